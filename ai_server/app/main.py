@@ -1,20 +1,92 @@
-import os
 import json
+import time
 import uuid
 import base64
+import binascii
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import AsyncGenerator, Dict, Optional, List, Literal
+from typing import Any, AsyncGenerator, Dict, Optional, List, Literal, Tuple
 from io import BytesIO
 
 import httpx
 from fastapi import FastAPI, Request, Query, Path, Form, File, UploadFile
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from starlette.background import BackgroundTask
+from starlette.datastructures import UploadFile as StarletteUploadFile
+from starlette.types import Message, Receive
 
-from app.services import get_chat_service
+import config
+from app.services import (
+    InvalidAudioError,
+    asr_cache,
+    asr_flight,
+    asr_preprocessor,
+    asr_uploads,
+    chat_cache,
+    chat_flight,
+    chat_providers,
+    get_chat_service,
+    prewarm_items,
+    speak_stream,
+    split_for_speech,
+    synthesize_batch,
+    synthesize_segments,
+    synthesize_speech,
+    tts_cache,
+    tts_flight,
+    transcribe,
+    transcribe_segments,
+    tts_prewarmer,
+)
+from app.support.audio import concat_mp3, strip_id3
+from app.support.audio_cache import CachedAudio
+from app.support import http_pool
+from app.support.persona import personas
+from app.support.limiter import UpstreamBusyError, limiters
+from app.support.upload import AudioUpload, UploadTooLargeError
 
-app = FastAPI(title="AI Server (FastAPI)")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 上游连接池：LLM / TTS / ASR 共用，复用 TCP/TLS 连接
+    await http_pool.startup()
+    # 启动时加载全部人设并预生成 system prompt，后台定期检查文件变更
+    await personas.start(config.PERSONA_RELOAD_INTERVAL)
+    # 从磁盘重建 TTS 音频缓存索引
+    await tts_cache.load_index()
+    # 可选：后台用角色语料和问候语预热 TTS 缓存
+    if config.TTS_PREWARM_ON_STARTUP:
+        tts_prewarmer.start(prewarm_items())
+    # 只导入并构建当前 AI_PROVIDER 对应的后端
+    get_chat_service()
+    try:
+        yield
+    finally:
+        await tts_prewarmer.stop()
+        await personas.stop()
+        await http_pool.shutdown()
+
+
+app = FastAPI(title="AI Server (FastAPI)", lifespan=lifespan)
+
+
+@app.exception_handler(UpstreamBusyError)
+async def upstream_busy_handler(request: Request, exc: UpstreamBusyError) -> JSONResponse:
+    retry_after = int(exc.retry_after or 1)
+    return JSONResponse(
+        {"error": str(exc)},
+        status_code=503,
+        headers={"Retry-After": str(max(1, retry_after))},
+    )
+
+
+@app.exception_handler(InvalidAudioError)
+async def invalid_audio_handler(request: Request, exc: InvalidAudioError) -> JSONResponse:
+    # 空的或无法识别的音频：直接返回 400，不调用上游
+    return JSONResponse({"error": str(exc)}, status_code=400)
 
 # ---- Global session storage ----
 SESSIONS: Dict[str, Dict] = {}
@@ -27,6 +99,7 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     characterId: str
     messages: List[ChatMessage]
+    sessionId: Optional[str] = None  # 可选，用于缓存早期对话摘要
 
 class TextMessageRequest(BaseModel):
     text: str
@@ -41,18 +114,67 @@ class ChatResponse(BaseModel):
 class TtsRequest(BaseModel):
     text: str
     voice: str
+    pipeline: bool = False  # 按句切分并发合成，再按顺序拼接
 
 class TtsResult(BaseModel):
     audioData: str  # Base64 编码的音频数据
     format: str     # 音频格式，如 "mp3", "wav"
     duration: int   # 音频时长（毫秒）
 
+class TtsBatchItem(BaseModel):
+    text: str
+    voice: str
+
+class TtsBatchRequest(BaseModel):
+    items: List[TtsBatchItem]
+
+class TtsBatchItemResult(BaseModel):
+    index: int      # 在请求 items 中的位置
+    audioData: str = ""
+    format: str = "mp3"
+    duration: int = 0
+    error: Optional[str] = None  # 该条合成失败时的错误信息，其余条目不受影响
+
+class TtsBatchResult(BaseModel):
+    results: List[TtsBatchItemResult]  # 与请求顺序一致
+    unique: int     # 去重后实际合成的条目数
+
 # ASR接口数据模型
 class AsrRequest(BaseModel):
     audioData: str  # Base64 编码的音频数据
 
+class AsrSegment(BaseModel):
+    start: int  # 毫秒
+    end: int    # 毫秒
+    text: str
+
 class AsrResult(BaseModel):
     text: str  # 识别出的文本
+    segments: Optional[List[AsrSegment]] = None  # 仅在 timestamps=true 时返回
+
+# 语音对话接口数据模型：音频进，文本 + 音频出
+class ConverseRequest(BaseModel):
+    characterId: str
+    audioData: str  # Base64 编码的用户语音
+    messages: List[ChatMessage] = []  # 之前的对话，识别结果作为最新一条用户消息
+    sessionId: Optional[str] = None
+
+class ConverseResult(BaseModel):
+    transcript: str  # 用户语音的识别结果
+    text: str        # 角色回复文本
+    audioData: str   # Base64 编码的回复音频（各句拼接）
+    format: str
+    duration: int    # 回复音频时长（毫秒）
+    timings: Dict[str, Optional[int]]  # 各阶段耗时（毫秒）
+
+
+def split_history(messages: List[ChatMessage]) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """Split into (history before the last user turn, last user text)."""
+    for i in range(len(messages) - 1, -1, -1):
+        if messages[i].role == "user":
+            history = [{"role": m.role, "content": m.content} for m in messages[:i] if m.content]
+            return history, messages[i].content
+    return [], None
 
 
 # ---- V1 API Endpoints ----
@@ -148,12 +270,8 @@ async def chat(
     if not request.messages:
         return ChatResponse(text="No messages provided")
     
-    # Get the last user message
-    last_message = None
-    for msg in reversed(request.messages):
-        if msg.role == "user":
-            last_message = msg.content
-            break
+    # Get the last user message; everything before it is history
+    history, last_message = split_history(request.messages)
     
     if not last_message:
         return ChatResponse(text="No user message found")
@@ -163,152 +281,245 @@ async def chat(
     
     # Generate AI response
     result_chunks: List[str] = []
-    async for token in service.stream_chat(request.characterId, None, last_message):
+    async for token in service.stream_chat(request.characterId, request.sessionId, last_message, history):
         result_chunks.append(token)
     ai_response = "".join(result_chunks).strip()
     
     return ChatResponse(text=ai_response)
 
 
+@app.post("/v1/chat/stream", tags=["chat"], summary="Chat with AI character (SSE streaming)")
+async def chat_stream(
+    request: ChatRequest,
+) -> EventSourceResponse:
+    """
+    Streaming variant of /v1/chat.
+    Emits each chunk from stream_chat as a `message` event as soon as it is
+    produced, then a final `done` event with the full text and timings (ms).
+    """
+    history, last_message = split_history(request.messages)
+
+    if not last_message:
+        return JSONResponse({"error": "No user message found"}, status_code=400)
+
+    service = get_chat_service()
+
+    async def event_generator() -> AsyncGenerator[dict, None]:
+        started = time.perf_counter()
+        first_chunk_ms: Optional[int] = None
+        result_chunks: List[str] = []
+        try:
+            async for token in service.stream_chat(request.characterId, request.sessionId, last_message, history):
+                if first_chunk_ms is None:
+                    first_chunk_ms = int((time.perf_counter() - started) * 1000)
+                result_chunks.append(token)
+                yield {"event": "message", "data": token}
+        except Exception as e:
+            print(f"Chat stream error: {str(e)}")
+            yield {"event": "error", "data": json.dumps({"error": str(e)}, ensure_ascii=False)}
+        yield {
+            "event": "done",
+            "data": json.dumps({
+                "text": "".join(result_chunks).strip(),
+                "firstChunkMs": first_chunk_ms,
+                "totalMs": int((time.perf_counter() - started) * 1000),
+            }, ensure_ascii=False),
+        }
+
+    return EventSourceResponse(event_generator())
+
+
+def speech_audio_event(
+    index: int,
+    sentence: str,
+    audio: Optional[CachedAudio],
+    error: Optional[BaseException],
+) -> dict:
+    """SSE `audio` event for one synthesized sentence of a spoken reply."""
+    if error is not None or audio is None or not audio.data:
+        print(f"TTS error for segment {index}: {error}")
+        data = {"index": index, "text": sentence, "error": str(error or "TTS returned no audio")}
+    else:
+        data = {
+            "index": index,
+            "text": sentence,
+            "audioData": base64.b64encode(audio.data).decode("ascii"),
+            "format": audio.format,
+            "duration": audio.duration,
+        }
+    return {"event": "audio", "data": json.dumps(data, ensure_ascii=False)}
+
+
+@app.post("/v1/chat/speech", tags=["chat"], summary="Chat with AI character and stream its speech (SSE)")
+async def chat_speech(
+    request: ChatRequest,
+) -> EventSourceResponse:
+    """
+    Chat and TTS overlapped: every completed sentence of the reply is sent to
+    TTS while the LLM is still generating.
+    Emits `message` events with the text chunks (as /v1/chat/stream) and
+    `audio` events in sentence order: {"index", "text", "audioData",
+    "format", "duration"}, or {"index", "text", "error"} for a sentence whose
+    synthesis failed. Ends with a `done` event: {"text", "segments",
+    "duration", "firstChunkMs", "firstAudioMs", "totalMs"} (ms).
+    """
+    history, last_message = split_history(request.messages)
+
+    if not last_message:
+        return JSONResponse({"error": "No user message found"}, status_code=400)
+
+    service = get_chat_service()
+
+    async def event_generator() -> AsyncGenerator[dict, None]:
+        started = time.perf_counter()
+        first_chunk_ms: Optional[int] = None
+        first_audio_ms: Optional[int] = None
+        result_chunks: List[str] = []
+        segments = 0
+        duration = 0
+        chunks = service.stream_chat(request.characterId, request.sessionId, last_message, history)
+        try:
+            async for kind, payload in speak_stream(chunks, request.characterId):
+                if kind == "text":
+                    if first_chunk_ms is None:
+                        first_chunk_ms = int((time.perf_counter() - started) * 1000)
+                    result_chunks.append(payload)
+                    yield {"event": "message", "data": payload}
+                    continue
+                audio = payload[2]
+                segments += 1
+                if audio is not None and audio.data:
+                    if first_audio_ms is None:
+                        first_audio_ms = int((time.perf_counter() - started) * 1000)
+                    duration += audio.duration
+                yield speech_audio_event(*payload)
+        except Exception as e:
+            print(f"Chat speech stream error: {str(e)}")
+            yield {"event": "error", "data": json.dumps({"error": str(e)}, ensure_ascii=False)}
+        yield {
+            "event": "done",
+            "data": json.dumps({
+                "text": "".join(result_chunks).strip(),
+                "segments": segments,
+                "duration": duration,
+                "firstChunkMs": first_chunk_ms,
+                "firstAudioMs": first_audio_ms,
+                "totalMs": int((time.perf_counter() - started) * 1000),
+            }, ensure_ascii=False),
+        }
+
+    return EventSourceResponse(event_generator())
+
+
+@app.get("/v1/characters", tags=["chat"], summary="List loaded character personas")
+async def list_characters() -> Dict[str, List[str]]:
+    return {"characters": personas.characters()}
+
+
+@app.get("/v1/admin/stats", tags=["admin"], summary="Cache and upstream statistics")
+async def admin_stats() -> Dict[str, Optional[Dict]]:
+    mock = chat_providers.backend("mock")
+    return {
+        "chatCache": chat_cache.stats(),
+        "ttsCache": tts_cache.stats(),
+        "asrCache": asr_cache.stats(),
+        "coalescing": {
+            "chat": chat_flight.stats(),
+            "tts": tts_flight.stats(),
+            "asr": asr_flight.stats(),
+        },
+        "upstream": {name: limiter.stats() for name, limiter in limiters.items()},
+        "ttsPrewarm": tts_prewarmer.stats(),
+        "asrPreprocess": asr_preprocessor.stats(),
+        "asrUploads": asr_uploads.stats() if asr_uploads else None,
+        "llm": chat_providers.stats(),
+        "mockLlm": mock.stats() if mock is not None else None,
+    }
+
+
+class PrewarmRequest(BaseModel):
+    characters: Optional[List[str]] = None  # 留空则预热全部角色
+
+
+@app.post("/v1/admin/tts/prewarm", tags=["admin"], summary="Start pre-warming the TTS cache")
+async def start_tts_prewarm(request: Optional[PrewarmRequest] = None) -> Dict:
+    """
+    Synthesizes the configured greetings and the MockLLM phrase corpus of
+    each character in the background, at low priority, so common replies
+    are already cached. Does nothing if a run is in progress.
+    """
+    started = tts_prewarmer.start(prewarm_items(request.characters if request else None))
+    return {"started": started, **tts_prewarmer.stats()}
+
+
+@app.delete("/v1/admin/tts/prewarm", tags=["admin"], summary="Stop pre-warming the TTS cache")
+async def stop_tts_prewarm() -> Dict:
+    await tts_prewarmer.stop()
+    return tts_prewarmer.stats()
+
+
+AUDIO_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav"}
+
+
+def wants_binary_audio(http_request: Request) -> bool:
+    """Content negotiation: raw audio when the caller accepts audio/mpeg (or audio/*)."""
+    accept = http_request.headers.get("accept", "").lower()
+    return "audio/mpeg" in accept or "audio/*" in accept
+
+
+def audio_headers(audio: CachedAudio) -> Dict[str, str]:
+    return {"X-Audio-Format": audio.format, "X-Audio-Duration": str(audio.duration)}
+
+
 @app.post("/v1/tts", tags=["media"], summary="Upload text and get audio")
 async def tts(
     request: TtsRequest,
+    http_request: Request,
 ) -> TtsResult:
     """
     TTS interface for external services to call via Feign.
     Converts text to speech using Qiniu Cloud TTS service.
+    Repeated texts are served from the audio cache and identical concurrent
+    requests share a single upstream call.
+    With `Accept: audio/mpeg` the audio is returned as raw bytes (duration and
+    format in X-Audio-* headers) instead of base64 inside JSON; pipelined
+    requests are then streamed segment by segment.
     """
+    print(f"TTS Request: text='{request.text}', voice='{request.voice}'")
+    binary = wants_binary_audio(http_request)
+    
     try:
-        # 人物语音映射和风格 - 使用七牛云不同的音色
-        voice_mapping = {
-            "harrypotter": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 11,  # 精品男声，男孩，活泼开朗 - 适合年轻的哈利波特
-                "speed_ratio": 1.1,
-                "style_prefix": "作为哈利·波特，我用年轻而勇敢的语气说："
-            },
-            "einstein": {
-                "voice_type": "qiniu_zh_female_wwxkjx", 
-                "spkid": 10,  # 精品男声，成熟正式，播音腔 - 适合深思熟虑的爱因斯坦
-                "speed_ratio": 0.9,
-                "style_prefix": "作为爱因斯坦，我用深思熟虑的语调说："
-            },
-            "confucius": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 13,  # 精品男声，央视新闻播音腔 - 适合庄重的孔子
-                "speed_ratio": 0.8,
-                "style_prefix": "作为孔子，我用庄重而智慧的语调说："
-            },
-            "socrates": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 12,  # 精品男声，常见解说配音腔 - 适合思辨的苏格拉底
-                "speed_ratio": 0.9,
-                "style_prefix": "作为苏格拉底，我用质疑和思辨的语调说："
-            },
-            "shakespeare": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 7,   # 精品女声，成熟，声音柔和纯美 - 适合戏剧性的莎士比亚
-                "speed_ratio": 1.0,
-                "style_prefix": "作为莎士比亚，我用戏剧性的语调说："
-            },
-            "marie-curie": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 14,  # 精品女声，少女音色 - 适合坚定的居里夫人
-                "speed_ratio": 1.0,
-                "style_prefix": "作为居里夫人，我用坚定而科学的语调说："
-            },
-            "default": {
-                "voice_type": "qiniu_zh_female_wwxkjx",
-                "spkid": 7,   # 默认使用精品女声
-                "speed_ratio": 1.0,
-                "style_prefix": ""
-            }
-        }
-        
-        # 获取对应的人物配置
-        character_config = voice_mapping.get(request.voice.lower(), voice_mapping["default"])
-        voice_type = character_config["voice_type"]
-        spkid = character_config["spkid"]
-        speed_ratio = character_config["speed_ratio"]
-        style_prefix = character_config["style_prefix"]
+        if binary and request.pipeline:
+            return await _stream_pipelined_audio(request.text, request.voice)
+        if request.pipeline:
+            audio = await _synthesize_pipelined(request.text, request.voice)
+        else:
+            audio = await synthesize_speech(request.text, request.voice)
         
-        # 构建带风格的文本
-        styled_text = f"{style_prefix}{request.text}" if style_prefix else request.text
+        print(f"Audio data length: {len(audio.data)} bytes")
+        print(f"Duration: {audio.duration}")
         
-        print(f"TTS Request: text='{styled_text}', voice='{request.voice}', voice_type='{voice_type}', spkid={spkid}, speed={speed_ratio}")
+        if binary:
+            return Response(
+                content=audio.data,
+                media_type=AUDIO_MEDIA_TYPES.get(audio.format, "application/octet-stream"),
+                headers=audio_headers(audio),
+            )
         
-        # 调用七牛云 TTS 服务
-        api_key = os.environ.get("QINIU_API_KEY", "sk-8b4e21c2efb5e8cc357dc1f3932dca4d644b79758d2a7bd2fe3d053ca809d5e2")
+        return TtsResult(
+            audioData=base64.b64encode(audio.data).decode("ascii"),
+            format=audio.format,
+            duration=audio.duration
+        )
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://openai.qiniu.com/v1/voice/tts",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "audio": {
-                        "voice_type": voice_type,
-                        "spkid": spkid,
-                        "encoding": "mp3",
-                        "speed_ratio": speed_ratio
-                    },
-                    "request": {
-                        "text": styled_text
-                    }
-                }
-            )
-            response.raise_for_status()
-            
-            # 解析响应
-            response_data = response.json()
-            print(f"TTS Response: {response_data}")
-            
-            # 获取音频数据
-            audio_data_base64 = response_data.get("data", "")
-            duration_str = response_data.get("addition", {}).get("duration", "0")
-            
-            # 检查音频数据是否有效
-            if not audio_data_base64:
-                print("Warning: 音频数据为空")
-                return TtsResult(
-                    audioData="",
-                    format="mp3", 
-                    duration=0
-                )
-            
-            # 检查 Base64 数据是否包含重复的填充字符
-            if audio_data_base64.count('A') > len(audio_data_base64) * 0.8:
-                print("Warning: 检测到异常的 Base64 数据（包含过多重复字符）")
-                # 尝试清理数据
-                audio_data_base64 = audio_data_base64.rstrip('A')
-                if not audio_data_base64:
-                    print("Error: 清理后音频数据为空")
-                    return TtsResult(
-                        audioData="",
-                        format="mp3",
-                        duration=0
-                    )
-            
-            # 转换时长为整数
-            try:
-                duration = int(duration_str)
-            except (ValueError, TypeError):
-                duration = len(request.text) * 100  # 估算时长
-            
-            print(f"Audio data length: {len(audio_data_base64)}")
-            print(f"Duration: {duration}")
-            
-            return TtsResult(
-                audioData=audio_data_base64,
-                format="mp3",
-                duration=duration
-            )
-            
+    except UpstreamBusyError:
+        # 上游繁忙：返回 503 + Retry-After，而不是空结果
+        raise
     except httpx.HTTPStatusError as e:
         # HTTP 错误处理
         print(f"HTTP Error: {e.response.status_code} - {e.response.text}")
+        if binary:
+            return JSONResponse({"error": f"TTS upstream error: {e.response.status_code}"}, status_code=502)
         return TtsResult(
             audioData="",  # 错误时返回空数据
             format="mp3",
@@ -317,6 +528,8 @@ async def tts(
     except Exception as e:
         # 其他错误处理
         print(f"TTS Error: {str(e)}")
+        if binary:
+            return JSONResponse({"error": f"TTS error: {str(e)}"}, status_code=502)
         return TtsResult(
             audioData="",  # 错误时返回空数据
             format="mp3",
@@ -324,6 +537,147 @@ async def tts(
         )
 
 
+async def _stream_pipelined_audio(text: str, voice: str) -> StreamingResponse:
+    """Chunked audio/mpeg: each sentence's frames are sent as soon as they are ready.
+
+    The first segment is awaited before the response starts, so an upstream
+    failure up front still reaches the caller as an error status. The total
+    duration is unknown when the headers go out, so only the segment count
+    is announced.
+    """
+    segments = split_for_speech(text, config.TTS_PIPELINE_MIN_CHARS)
+    audio_segments = synthesize_segments(segments, voice)
+    try:
+        _, first = await audio_segments.__anext__()
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await audio_segments.aclose()
+        raise
+
+    async def chunks() -> AsyncGenerator[bytes, None]:
+        try:
+            if first is not None and first.data:
+                yield strip_id3(first.data)
+            async for _, audio in audio_segments:
+                if audio.data:
+                    yield strip_id3(audio.data)
+        except Exception as e:
+            # Headers are already sent; end the stream early
+            print(f"TTS stream error: {str(e)}")
+        finally:
+            await audio_segments.aclose()
+
+    return StreamingResponse(
+        chunks(),
+        media_type="audio/mpeg",
+        headers={"X-Audio-Format": "mp3", "X-Audio-Segments": str(len(segments))},
+        # also stops the remaining syntheses if the body is never sent
+        background=BackgroundTask(audio_segments.aclose),
+    )
+
+
+async def _synthesize_pipelined(text: str, voice: str) -> CachedAudio:
+    segments = split_for_speech(text, config.TTS_PIPELINE_MIN_CHARS)
+    if len(segments) <= 1:
+        return await synthesize_speech(text, voice)
+    clips = [audio async for _, audio in synthesize_segments(segments, voice)]
+    return CachedAudio(
+        concat_mp3(clip.data for clip in clips),
+        "mp3",
+        sum(clip.duration for clip in clips),
+    )
+
+
+@app.post("/v1/tts/stream", tags=["media"], summary="Sentence-pipelined TTS (NDJSON stream)")
+async def tts_stream(
+    request: TtsRequest,
+) -> StreamingResponse:
+    """
+    Splits the text into sentences, synthesizes them concurrently and streams
+    one NDJSON line per segment in order as soon as it is ready:
+    {"index", "text", "audioData", "format", "duration"}, then a final
+    {"done": true, "segments", "duration"} line with the total duration (ms).
+    """
+    segments = split_for_speech(request.text, config.TTS_PIPELINE_MIN_CHARS)
+
+    async def lines() -> AsyncGenerator[bytes, None]:
+        total = 0
+        try:
+            async for i, audio in synthesize_segments(segments, request.voice):
+                total += audio.duration
+                yield (json.dumps({
+                    "index": i,
+                    "text": segments[i],
+                    "audioData": base64.b64encode(audio.data).decode("ascii"),
+                    "format": audio.format,
+                    "duration": audio.duration,
+                }, ensure_ascii=False) + "\n").encode("utf-8")
+        except Exception as e:
+            print(f"TTS stream error: {str(e)}")
+            yield (json.dumps({"error": str(e)}, ensure_ascii=False) + "\n").encode("utf-8")
+            return
+        yield (json.dumps({"done": True, "segments": len(segments), "duration": total}) + "\n").encode("utf-8")
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+def _batch_item_results(
+    indices: List[int],
+    audio: Optional[CachedAudio],
+    error: Optional[BaseException],
+) -> List[TtsBatchItemResult]:
+    if error is not None:
+        if isinstance(error, httpx.HTTPStatusError):
+            message = f"TTS upstream error: {error.response.status_code}"
+        else:
+            message = str(error) or type(error).__name__
+        return [TtsBatchItemResult(index=i, error=message) for i in indices]
+    if audio is None or not audio.data:
+        return [TtsBatchItemResult(index=i, error="TTS returned no audio") for i in indices]
+    audio_data = base64.b64encode(audio.data).decode("ascii")
+    return [
+        TtsBatchItemResult(index=i, audioData=audio_data, format=audio.format, duration=audio.duration)
+        for i in indices
+    ]
+
+
+@app.post("/v1/tts/batch", tags=["media"], summary="Synthesize many texts in one call")
+async def tts_batch(
+    request: TtsBatchRequest,
+    http_request: Request,
+) -> TtsBatchResult:
+    """
+    Synthesizes many (text, voice) items concurrently. Identical items are
+    synthesized once. A failed item carries an `error` instead of failing the
+    whole batch.
+    Returns one JSON document with results in request order, or with
+    `Accept: application/x-ndjson` one line per item in completion order.
+    """
+    if len(request.items) > config.TTS_BATCH_MAX_ITEMS:
+        return JSONResponse(
+            {"error": f"too many items: {len(request.items)} > {config.TTS_BATCH_MAX_ITEMS}"},
+            status_code=413,
+        )
+    items = [(item.text, item.voice) for item in request.items]
+    unique = len(set(items))
+    print(f"TTS Batch Request: {len(items)} items, {unique} unique")
+
+    if "application/x-ndjson" in http_request.headers.get("accept", "").lower():
+        async def lines() -> AsyncGenerator[bytes, None]:
+            async for indices, audio, error in synthesize_batch(items):
+                for result in _batch_item_results(indices, audio, error):
+                    yield (result.model_dump_json(exclude_none=True) + "\n").encode("utf-8")
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    results: List[Optional[TtsBatchItemResult]] = [None] * len(items)
+    async for indices, audio, error in synthesize_batch(items):
+        for result in _batch_item_results(indices, audio, error):
+            results[result.index] = result
+    return TtsBatchResult(results=results, unique=unique)
+
+
 # @app.post("/api/v1/sessions/{sessionId}/audio", tags=["sessions"], summary="Send an audio message")
 # async def send_audio(
 #     sessionId: str = Path(..., description="Session ID"),
@@ -355,60 +709,143 @@ async def tts(
 
 # ---- Media Endpoints ----
 
-@app.post("/v1/asr", tags=["media"], summary="Upload audio and get text")
+ASR_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": AsrRequest.model_json_schema()},
+            "audio/*": {"schema": {"type": "string", "format": "binary"}},
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                },
+            },
+        },
+    },
+}
+
+
+def request_validation_response(error: ValidationError) -> JSONResponse:
+    """422 in the shape FastAPI gives a declared JSON body (`loc` starts with "body")."""
+    errors = [{**e, "loc": ("body", *e["loc"])} for e in error.errors(include_url=False)]
+    return JSONResponse({"detail": jsonable_encoder(errors)}, status_code=422)
+
+
+# Room for multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def _limited_receive(receive: Receive, body_limit: int, max_bytes: int) -> Receive:
+    """`receive` that raises UploadTooLargeError once the body passes `body_limit`."""
+    received = 0
+
+    async def limited() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > body_limit:
+                raise UploadTooLargeError(max_bytes)
+        return message
+
+    return limited
+
+
+async def read_audio_upload(http_request: Request) -> Tuple[Optional[AudioUpload], Optional[AsrRequest]]:
+    """Audio of an ASR-style request: a raw `audio/*` body, a multipart `file`
+    part (both spooled, never fully in memory) or the JSON AsrRequest.
+    Raises UploadTooLargeError past ASR_MAX_UPLOAD_MB.
+    """
+    max_bytes = config.ASR_MAX_UPLOAD_MB * 1024 * 1024
+    content_type = http_request.headers.get("content-type", "").lower()
+    if content_type.startswith("multipart/form-data"):
+        # The body limit is enforced while Starlette spools the part, and the
+        # exact part size once it is complete
+        body_limit = max_bytes + MULTIPART_OVERHEAD_BYTES
+        if int(http_request.headers.get("content-length") or 0) > body_limit:
+            raise UploadTooLargeError(max_bytes)
+        limited = Request(http_request.scope, _limited_receive(http_request.receive, body_limit, max_bytes))
+        form = await limited.form(max_files=1)
+        part = form.get("file") or form.get("audio")
+        if not isinstance(part, StarletteUploadFile):
+            await form.close()
+            return None, None
+        upload = AudioUpload.from_file(part.file, part.content_type or "")
+        if upload.size > max_bytes:
+            upload.close()
+            raise UploadTooLargeError(max_bytes)
+        return upload, None
+    if content_type.startswith(("audio/", "application/octet-stream")):
+        upload = await AudioUpload.from_stream(
+            http_request.stream(), max_bytes, config.ASR_SPOOL_MEMORY_KB * 1024, content_type
+        )
+        return upload, None
+    return None, AsrRequest.model_validate_json(await http_request.body())
+
+
+@app.post(
+    "/v1/asr",
+    tags=["media"],
+    summary="Upload audio and get text",
+    openapi_extra=ASR_UPLOAD_OPENAPI,
+    response_model_exclude_none=True,
+)
 async def asr(
-    request: AsrRequest,
+    http_request: Request,
+    timestamps: bool = Query(False, description="Also return per-segment start/end times (ms)"),
 ) -> AsrResult:
     """
     ASR interface for external services to call via Feign.
     Converts audio to text using Qiniu Cloud ASR service.
-    Accepts Base64 encoded audio data.
+    Accepts Base64 encoded audio data (AsrRequest JSON), a raw `audio/*`
+    body, or a multipart upload with a `file` part. Raw and multipart
+    uploads are spooled to disk past ASR_SPOOL_MEMORY_KB and base64-encoded
+    only once, while streaming to the upstream. The format is detected from
+    the audio's magic bytes.
+    PCM WAV longer than ASR_LONG_AUDIO_SECONDS is split at pauses and the
+    segments are transcribed concurrently, then stitched back in order.
+    Clips above ASR_UPLOAD_THRESHOLD_KB are uploaded to object storage once
+    (keyed by content hash) and the upstream is given their URL.
+    Empty or unrecognised audio is rejected with 400 without calling the upstream.
     """
+    upload: Optional[AudioUpload] = None
     try:
-        # 解码 Base64 音频数据
         try:
-            audio_data = base64.b64decode(request.audioData)
-        except Exception as e:
-            print(f"Base64 decode error: {str(e)}")
-            return AsrResult(text="")
-        
-        print(f"ASR Request: size={len(audio_data)} bytes")
-        print(f"Base64 data length: {len(request.audioData)} characters")
-        print(f"Base64 data preview: {request.audioData[:50]}...")
-        
-        # 调用七牛云 ASR 服务
-        api_key = os.environ.get("QINIU_API_KEY", "sk-8b4e21c2efb5e8cc357dc1f3932dca4d644b79758d2a7bd2fe3d053ca809d5e2")
+            upload, request = await read_audio_upload(http_request)
+        except UploadTooLargeError as e:
+            return JSONResponse({"error": str(e)}, status_code=413)
+        except ValidationError as e:
+            return request_validation_response(e)
         
-        print(f"API Key: {api_key[:20]}...")
+        if upload is not None:
+            print(f"ASR Request: size={upload.size} bytes, content-type={upload.content_type!r}")
+            transcript = await transcribe_segments(upload)
+        elif request is not None:
+            # 解码 Base64 音频数据（本地校验音频头用），原字符串直接发往上游
+            try:
+                audio_data = base64.b64decode(request.audioData)
+            except Exception as e:
+                print(f"Base64 decode error: {str(e)}")
+                return AsrResult(text="")
+            print(f"ASR Request: size={len(audio_data)} bytes")
+            transcript = await transcribe_segments(audio_data, request.audioData)
+        else:
+            print("ASR Request: multipart upload without a file part")
+            return AsrResult(text="")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            print("Sending request to Qiniu ASR API...")
-            response = await client.post(
-                "https://openai.qiniu.com/v1/voice/asr",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "asr",
-                    "audioBase64": request.audioData,  # 使用 audioBase64 参数
-                    "format": "mp3"
-                }
+        print(f"ASR Result: '{transcript.text}'")
+        if timestamps:
+            return AsrResult(
+                text=transcript.text,
+                segments=[AsrSegment(start=start, end=end, text=text) for start, end, text in transcript.segments],
             )
-            print(f"Response status: {response.status_code}")
-            print(f"Response headers: {dict(response.headers)}")
-            
-            response.raise_for_status()
-            
-            # 解析响应
-            response_data = response.json()
-            print(f"Full response: {response_data}")
-            
-            recognized_text = response_data.get("data", {}).get("result", {}).get("text", "")
-            
-            print(f"ASR Result: '{recognized_text}'")
-            return AsrResult(text=recognized_text)
-            
+        return AsrResult(text=transcript.text)
+        
+    except (UpstreamBusyError, InvalidAudioError):
+        # 上游繁忙：返回 503 + Retry-After；空的或无法识别的音频：400，而不是空结果
+        raise
     except httpx.HTTPStatusError as e:
         # HTTP 错误处理
         print(f"ASR HTTP Error: {e.response.status_code} - {e.response.text}")
@@ -417,6 +854,133 @@ async def asr(
         # 其他错误处理
         print(f"ASR Error: {str(e)}")
         return AsrResult(text="")  # 错误时返回空文本
+    finally:
+        if upload is not None:
+            upload.close()
+
+
+async def _converse_events(
+    request: ConverseRequest,
+    audio_data: bytes,
+    timings: Dict[str, Optional[int]],
+) -> AsyncGenerator[Tuple[str, Any], None]:
+    """ASR -> chat -> sentence-pipelined TTS, as ("transcript" | "text" | "audio", payload) events.
+
+    Fills `timings` (ms since the request started) along the way.
+    """
+    started = time.perf_counter()
+
+    def mark(name: str) -> None:
+        if timings.get(name) is None:
+            timings[name] = int((time.perf_counter() - started) * 1000)
+
+    transcript = (await transcribe(audio_data, request.audioData)).strip()
+    mark("asrMs")
+    yield "transcript", transcript
+    if not transcript:
+        return
+
+    history = [{"role": m.role, "content": m.content} for m in request.messages if m.content]
+    service = get_chat_service()
+
+    async def chat_chunks() -> AsyncGenerator[str, None]:
+        async for chunk in service.stream_chat(request.characterId, request.sessionId, transcript, history):
+            mark("firstChunkMs")
+            yield chunk
+        mark("chatMs")
+
+    async for kind, payload in speak_stream(chat_chunks(), request.characterId):
+        if kind == "audio" and payload[2] is not None and payload[2].data:
+            mark("firstAudioMs")
+        yield kind, payload
+    mark("totalMs")
+
+
+@app.post("/v1/converse", tags=["media"], summary="Voice turn: audio in, reply text and audio out")
+async def converse(
+    request: ConverseRequest,
+    http_request: Request,
+) -> ConverseResult:
+    """
+    One round trip for a voice message: ASR, chat and sentence-pipelined TTS
+    run in this process. Timings (ms from the start): asrMs, firstChunkMs,
+    firstAudioMs, chatMs, totalMs.
+    Returns ConverseResult JSON, or with `Accept: text/event-stream` streams
+    `transcript` ({"text", "asrMs"}), `message` and `audio` events as
+    /v1/chat/speech, then `done` ({"transcript", "text", "duration", "timings"}).
+    Audio that is not valid base64, is empty or is not recognisable audio is
+    rejected with 400 (an `error` event when streaming) before anything runs.
+    """
+    # 先在本地校验音频，避免对空音频做 ASR 再让 LLM/TTS 回复空文本
+    try:
+        audio_data = base64.b64decode(request.audioData, validate=True)
+    except binascii.Error as e:
+        return JSONResponse({"error": f"invalid base64 audio: {e}"}, status_code=400)
+    if not audio_data:
+        return JSONResponse({"error": "audio is empty"}, status_code=400)
+    timings: Dict[str, Optional[int]] = dict.fromkeys(("asrMs", "firstChunkMs", "firstAudioMs", "chatMs", "totalMs"))
+
+    if "text/event-stream" in http_request.headers.get("accept", "").lower():
+        async def event_generator() -> AsyncGenerator[dict, None]:
+            transcript = ""
+            result_chunks: List[str] = []
+            duration = 0
+            try:
+                async for kind, payload in _converse_events(request, audio_data, timings):
+                    if kind == "transcript":
+                        transcript = payload
+                        yield {"event": "transcript", "data": json.dumps(
+                            {"text": payload, "asrMs": timings["asrMs"]}, ensure_ascii=False)}
+                    elif kind == "text":
+                        result_chunks.append(payload)
+                        yield {"event": "message", "data": payload}
+                    else:
+                        audio = payload[2]
+                        if audio is not None and audio.data:
+                            duration += audio.duration
+                        yield speech_audio_event(*payload)
+            except Exception as e:
+                print(f"Converse stream error: {str(e)}")
+                yield {"event": "error", "data": json.dumps({"error": str(e)}, ensure_ascii=False)}
+            yield {
+                "event": "done",
+                "data": json.dumps({
+                    "transcript": transcript,
+                    "text": "".join(result_chunks).strip(),
+                    "duration": duration,
+                    "timings": timings,
+                }, ensure_ascii=False),
+            }
+
+        return EventSourceResponse(event_generator())
+
+    transcript = ""
+    result_chunks: List[str] = []
+    clips: List[CachedAudio] = []
+    try:
+        async for kind, payload in _converse_events(request, audio_data, timings):
+            if kind == "transcript":
+                transcript = payload
+            elif kind == "text":
+                result_chunks.append(payload)
+            elif payload[2] is not None:
+                clips.append(payload[2])
+            else:
+                print(f"Converse TTS error for segment {payload[0]}: {payload[3]}")
+    except (UpstreamBusyError, InvalidAudioError):
+        # 上游繁忙：返回 503 + Retry-After；无法识别的音频：400
+        raise
+    except Exception as e:
+        print(f"Converse Error: {str(e)}")
+    audio = concat_mp3(clip.data for clip in clips)
+    return ConverseResult(
+        transcript=transcript,
+        text="".join(result_chunks).strip(),
+        audioData=base64.b64encode(audio).decode("ascii"),
+        format="mp3",
+        duration=sum(clip.duration for clip in clips),
+        timings=timings,
+    )
 
 
 # @app.post("/v1/tts", tags=["media"], summary="Upload text and get audio")
@@ -1,71 +1,751 @@
+import base64
+import binascii
+import asyncio
 import os
-from typing import AsyncGenerator, Protocol, Optional
+import re
+import time
+import unicodedata
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, List, Protocol, Optional, Tuple, TypeVar, Union
 
-from app.support.persona import load_persona
-from app.support.prompt import build_prompt
-from app.vendors.openai_llm import OpenAILLM
-from app.vendors.mock_llm import MockLLM
+from app.support.audio import AudioInfo, Buffer, parse_mp3, probe_audio
+from app.support.audio_dsp import WAV_HEADER_SIZE, WavPreprocessor
+from app.support.audio_cache import AudioCache, CachedAudio, audio_digest, content_key
+from app.support.cache import TTLCache
+from app.support.coalesce import SingleFlight, StreamCoalescer
+from app.support.context import ContextManager, conversation_key, extractive_summary
+from app.support.persona import personas
+from app.support.limiter import limiters
+from app.support.prewarm import Prewarmer
+from app.support.segmenter import StreamSegmenter, iter_words, join_transcripts, split_text
+from app.support.storage import StoredAudio, create_storage
+from app.support.upload import AudioUpload, guess_format, holding
+from app.vendors import qiniu_asr, qiniu_tts
 import config
 
+T = TypeVar("T")
+
 
 class ChatService(Protocol):
-    async def stream_chat(self, role: str, session_id: Optional[str], user_text: str) -> AsyncGenerator[str, None]:
+    async def stream_chat(
+        self,
+        role: str,
+        session_id: Optional[str],
+        user_text: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ) -> AsyncGenerator[str, None]:
         ...
 
 
 class MockChatService:
-    async def stream_chat(self, role: str, session_id: Optional[str], user_text: str):
-        # 直接使用MockLLM，简化逻辑
-        punctuation = set(" \t\n\r,.!?，。！？；：、")
-        buffer = ""
-        
-        # 使用MockLLM
-        async for piece in MockLLM().stream_generate(user_text, role):
-            buffer += piece
-            if piece in punctuation:
-                word = buffer.strip()
-                if word:
-                    yield word
-                buffer = ""
-        if buffer.strip():
-            yield buffer.strip()
+    def __init__(self) -> None:
+        # 语料表、匹配器和压测模拟只在选用 mock 时才导入
+        from app.vendors.mock_llm import MockLLM
+
+        self.llm = MockLLM()
+
+    async def stream_chat(
+        self,
+        role: str,
+        session_id: Optional[str],
+        user_text: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ):
+        # MockLLM 只按关键词匹配当前输入，忽略历史
+        # 直接使用MockLLM，简化逻辑；延迟、速率和故障注入见 MOCK_LLM_* 配置
+        # 使用MockLLM，按词/标点切分
+        async for word in iter_words(self.llm.stream_generate(user_text, role)):
+            yield word
+
+    def stats(self) -> Dict[str, Any]:
+        return self.llm.upstream.stats()
+
+
+async def _llm_summary(previous: str, turns: List[Dict[str, str]]) -> str:
+    """Summarize dropped turns with the chat model (CONTEXT_SUMMARY_MODE=llm)."""
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in turns)
+    prompt = (
+        "Summarize the conversation below in a few short Chinese sentences, "
+        "keeping names, facts and open questions.\n\n"
+        f"Previous summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+    )
+    from app.vendors.openai_llm import OpenAILLM
+
+    client = OpenAILLM(
+        api_key=config.OPENAI_API_KEY,
+        model=config.OPENAI_MODEL,
+        base_url=config.OPENAI_BASE_URL,
+    )
+    parts: List[str] = []
+    async for delta in client.chat_stream(messages=[{"role": "user", "content": prompt}]):
+        parts.append(delta)
+    return "".join(parts).strip()
+
+
+# Shared across requests so the rolling summaries survive get_chat_service()
+_context_manager = ContextManager(
+    summarizer=_llm_summary if config.CONTEXT_SUMMARY_MODE == "llm" else extractive_summary,
+)
 
 
 class OpenAIChatService:
     def __init__(self) -> None:
+        from app.vendors.openai_llm import OpenAILLM
+
         # 使用七牛云的 OpenAI 兼容 API 服务
         self.client = OpenAILLM(
             api_key=config.OPENAI_API_KEY,
             model=config.OPENAI_MODEL,
             base_url=config.OPENAI_BASE_URL,
         )
+        self.context = _context_manager
+
+    async def stream_chat(
+        self,
+        role: str,
+        session_id: Optional[str],
+        user_text: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ):
+        # Precompiled persona + instructions, without conversation scaffolding
+        system_only = personas.system_prompt(role)
+
+        history = history or []
+        messages = await self.context.build_messages(
+            conversation_id=conversation_key(role, session_id, history),
+            model=self.client.model,
+            system=system_only,
+            history=history,
+            user_text=user_text,
+        )
+
+        # Chunk assistant deltas by word/punctuation
+        async for word in iter_words(self._contents(messages)):
+            yield word
+
+    async def _contents(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Content deltas of one stream; the final event's finish_reason and usage are logged."""
+        async for event in self.client.chat_events(messages=messages):
+            if not event.final:
+                yield event.content
+                continue
+            if event.finish_reason not in (None, "stop"):
+                print(f"Chat stream finished with reason {event.finish_reason}")
+            if event.usage:
+                print(f"Chat stream usage: {event.usage}")
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip().lower()
+
+
+def chat_key(role: str, model: str, history: List[Dict[str, str]], user_text: str) -> Tuple:
+    """Identity of a chat request: character, model and normalized conversation."""
+    turns = tuple((m["role"], _normalize(m["content"])) for m in history)
+    return (role.strip().lower(), model, turns, _normalize(user_text))
+
+
+class ChatResponseCache:
+    """Exact-match cache of finished replies, keyed on (character, model, conversation).
+
+    Entries of a character are dropped as soon as its persona is reloaded.
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.entries: TTLCache[Tuple, List[str]] = TTLCache(max_entries, ttl)
+        self.invalidations = 0
+
+    def make_key(self, role: str, model: str, history: List[Dict[str, str]], user_text: str) -> Tuple:
+        return chat_key(role, model, history, user_text)
+
+    def invalidate_character(self, role: str) -> int:
+        role = role.strip().lower()
+        self.invalidations += 1
+        if role == "default":
+            # Characters without their own file fall back to the default persona
+            own = set(personas.characters())
+            return self.entries.remove_if(lambda key: key[0] == role or key[0] not in own)
+        return self.entries.remove_if(lambda key: key[0] == role)
+
+    def get(self, key: Tuple) -> Optional[List[str]]:
+        return self.entries.get(key)
+
+    def set(self, key: Tuple, chunks: List[str]) -> None:
+        self.entries.set(key, chunks)
+
+    def stats(self) -> Dict[str, float]:
+        return {**self.entries.stats(), "invalidations": self.invalidations}
+
 
-    async def stream_chat(self, role: str, session_id: Optional[str], user_text: str):
-        persona = load_persona(role)
-        # Build a system prompt containing persona and instructions only
-        system_full = build_prompt(persona, "")
-        # Strip conversation section if present to avoid leaking scaffolding
-        system_only = system_full.split("# Conversation", 1)[0].strip()
-
-        punctuation = set(" \t\n\r,.!?，。！？；：、")
-        buffer = ""
-        # Stream assistant deltas only, chunk by word/punctuation
-        async for delta in self.client.chat_stream(system=system_only, user=user_text):
-            for ch in delta:
-                buffer += ch
-                if ch in punctuation:
-                    word = buffer.strip()
-                    if word:
-                        yield word
-                    buffer = ""
-        if buffer.strip():
-            yield buffer.strip()
+chat_cache = ChatResponseCache(config.CHAT_CACHE_MAX_ENTRIES, config.CHAT_CACHE_TTL)
+personas.add_listener(chat_cache.invalidate_character)
+
+
+class CachedChatService:
+    """Serve repeated conversations from chat_cache in front of any ChatService."""
+
+    def __init__(self, inner: ChatService, model: str, cache: ChatResponseCache = chat_cache) -> None:
+        self.inner = inner
+        self.model = model
+        self.cache = cache
+
+    async def stream_chat(
+        self,
+        role: str,
+        session_id: Optional[str],
+        user_text: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ):
+        history = history or []
+        if len(history) >= config.CHAT_CACHE_MAX_HISTORY:
+            # Long conversations almost never repeat; don't let them flush the cache
+            async for chunk in self.inner.stream_chat(role, session_id, user_text, history):
+                yield chunk
+            return
+
+        key = self.cache.make_key(role, self.model, history, user_text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            for chunk in cached:
+                yield chunk
+            return
+
+        chunks: List[str] = []
+        async for chunk in self.inner.stream_chat(role, session_id, user_text, history):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete, non-empty replies are cached
+        if chunks:
+            self.cache.set(key, chunks)
+
+
+chat_flight: StreamCoalescer[str] = StreamCoalescer()
+
+
+class CoalescingChatService:
+    """Concurrent identical chat requests share one upstream stream."""
+
+    def __init__(self, inner: ChatService, model: str, flight: StreamCoalescer[str] = chat_flight) -> None:
+        self.inner = inner
+        self.model = model
+        self.flight = flight
+
+    async def stream_chat(
+        self,
+        role: str,
+        session_id: Optional[str],
+        user_text: str,
+        history: Optional[List[Dict[str, str]]] = None,
+    ):
+        history = history or []
+        key = chat_key(role, self.model, history, user_text)
+        stream = self.flight.stream(key, lambda: self.inner.stream_chat(role, session_id, user_text, history))
+        async for chunk in stream:
+            yield chunk
+
+
+def llm_provider() -> str:
+    return os.environ.get("AI_PROVIDER", "openai").lower()
+
+
+class ChatProviders:
+    """Chat backends by AI_PROVIDER name, each imported and built once per process.
+
+    A factory imports its vendor module itself, so only the backend that is
+    actually selected is ever loaded. The built service (backend behind
+    coalescing and the reply cache) is reused by every request. Unknown
+    names get the `fallback` backend.
+    """
+
+    def __init__(self, fallback: str) -> None:
+        self.fallback = fallback
+        self._factories: Dict[str, Callable[[], Tuple[ChatService, str]]] = {}
+        self._backends: Dict[str, ChatService] = {}
+        self._services: Dict[str, ChatService] = {}
+        self._build_ms: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Tuple[ChatService, str]]) -> None:
+        """`factory` returns the backend and the model name used in cache keys."""
+        self._factories[name] = factory
+
+    def get(self, name: str) -> ChatService:
+        if name not in self._factories:
+            name = self.fallback
+        service = self._services.get(name)
+        if service is None:
+            started = time.perf_counter()
+            backend, model = self._factories[name]()
+            service = CoalescingChatService(backend, model)
+            if config.CHAT_CACHE_ENABLED:
+                service = CachedChatService(service, model)
+            self._backends[name] = backend
+            self._services[name] = service
+            self._build_ms[name] = (time.perf_counter() - started) * 1000
+        return service
+
+    def backend(self, name: str) -> Optional[ChatService]:
+        """The bare backend, if it has been built."""
+        return self._backends.get(name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "provider": llm_provider(),
+            "loaded": {name: {"buildMs": round(ms, 2)} for name, ms in self._build_ms.items()},
+        }
+
+
+def _openai_backend() -> Tuple[ChatService, str]:
+    return OpenAIChatService(), config.OPENAI_MODEL
+
+
+def _mock_backend() -> Tuple[ChatService, str]:
+    return MockChatService(), "mock"
+
+
+chat_providers = ChatProviders(fallback="mock")
+chat_providers.register("openai", _openai_backend)
+chat_providers.register("mock", _mock_backend)
 
 
 def get_chat_service() -> ChatService:
-    provider = os.environ.get("AI_PROVIDER", "openai").lower()
-    if provider == "openai":
-        return OpenAIChatService()
-    return MockChatService()
+    """Chat service for the current AI_PROVIDER, built on first use."""
+    return chat_providers.get(llm_provider())
+
+
+# ---- Speech synthesis ----
+
+tts_cache = AudioCache(
+    Path(config.TTS_CACHE_DIR) if config.TTS_CACHE_DIR else None,
+    memory_max_bytes=config.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+    disk_max_bytes=config.TTS_CACHE_DISK_MB * 1024 * 1024,
+)
+# 相同 TTS 请求（音色 + 文本）并发时只调用一次上游
+tts_flight: SingleFlight[CachedAudio] = SingleFlight()
+
+EMPTY_AUDIO = CachedAudio(b"", "mp3", 0)
+
+
+async def synthesize_speech(text: str, voice: str, with_style: bool = True) -> CachedAudio:
+    """Speech for `text` in the character's voice: cache, then one shared upstream call.
+
+    `with_style=False` leaves out the character's spoken style prefix (used
+    for every segment but the first of a split reply).
+    Returns EMPTY_AUDIO when the upstream answers without usable audio;
+    upstream HTTP errors and UpstreamBusyError propagate.
+    """
+    key, voice_config, styled = _speech_request(text, voice, with_style)
+    if config.TTS_CACHE_ENABLED:
+        cached = await tts_cache.get(key)
+        if cached is not None:
+            return cached
+    return await tts_flight.run(key, lambda: _synthesize_uncached(key, voice_config, styled))
+
+
+def _speech_request(text: str, voice: str, with_style: bool) -> Tuple[str, Dict, str]:
+    voice_config = qiniu_tts.resolve_voice(voice)
+    styled = qiniu_tts.styled_text(text, voice_config) if with_style else text
+    return content_key(*qiniu_tts.synthesis_key(voice_config, styled), "mp3"), voice_config, styled
+
+
+def speech_cached(text: str, voice: str, with_style: bool = True) -> bool:
+    return config.TTS_CACHE_ENABLED and tts_cache.contains(_speech_request(text, voice, with_style)[0])
+
+
+async def _synthesize_uncached(key: str, voice_config: Dict, styled: str) -> CachedAudio:
+    # 调用七牛云 TTS 服务
+    response_data = await qiniu_tts.synthesize(voice_config, styled)
+    
+    # 获取音频数据
+    audio_data_base64 = response_data.get("data", "")
+    
+    # 检查音频数据是否有效
+    if not audio_data_base64:
+        print("Warning: 音频数据为空")
+        return EMPTY_AUDIO
+    
+    try:
+        data = base64.b64decode(audio_data_base64 + "=" * (-len(audio_data_base64) % 4))
+    except binascii.Error as e:
+        print(f"Error: 音频 Base64 解码失败: {e}")
+        return EMPTY_AUDIO
+    
+    # 逐帧解析 MP3 头：精确时长、截断/损坏检测，并裁掉尾部填充
+    info = parse_mp3(data)
+    if not info.frames:
+        print(f"Error: 音频数据中没有有效的 MP3 帧: {'; '.join(info.issues)}")
+        return EMPTY_AUDIO
+    if info.issues:
+        print(f"Warning: 音频数据异常: {'; '.join(info.issues)}")
+    if info.end < len(data):
+        data = data[:info.end]  # 截断的末帧 / 尾部填充（含 ID3v1 标签）
+    duration = info.duration_ms
+    
+    audio = CachedAudio(data, "mp3", duration)
+    if config.TTS_CACHE_ENABLED:
+        await tts_cache.put(key, audio)
+    return audio
+
+
+def split_for_speech(text: str, min_chars: int = 0) -> List[str]:
+    """Sentence segments for pipelined TTS; short ones are merged into the next."""
+    segments: List[str] = []
+    pending = ""
+    for sentence in split_text(text, "sentence"):
+        pending += sentence
+        if len(pending) >= min_chars:
+            segments.append(pending)
+            pending = ""
+    if pending:
+        if segments and len(pending) < min_chars:
+            segments[-1] += pending
+        else:
+            segments.append(pending)
+    return segments
+
+
+async def synthesize_segments(
+    segments: List[str],
+    voice: str,
+    parallelism: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, CachedAudio]]:
+    """Synthesize segments concurrently (bounded) and yield them in order.
+
+    Segment i is yielded as soon as it and every segment before it are
+    ready, so the first audio is available after a single-sentence call.
+    """
+    semaphore = asyncio.Semaphore(parallelism or config.TTS_PIPELINE_PARALLELISM)
+
+    async def one(i: int, segment: str) -> CachedAudio:
+        async with semaphore:
+            return await synthesize_speech(segment, voice, with_style=(i == 0))
+
+    tasks = [asyncio.ensure_future(one(i, segment)) for i, segment in enumerate(segments)]
+    try:
+        for i, task in enumerate(tasks):
+            yield i, await task
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # already surfaced or irrelevant once we stop
+
+
+async def speak_stream(
+    chunks: AsyncIterator[str],
+    voice: str,
+    parallelism: Optional[int] = None,
+    min_chars: Optional[int] = None,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Overlap a streaming reply with its speech synthesis.
+
+    Yields ("text", chunk) as soon as each chunk arrives and
+    ("audio", (index, sentence, audio, error)) per sentence in reply order.
+    A sentence goes to TTS as soon as it is complete (short ones are merged
+    into the next), so the first audio is ready after the first sentence
+    plus one TTS call while the LLM keeps generating. A failed sentence
+    carries its error instead of ending the stream; errors from `chunks`
+    propagate after the audio of the sentences seen so far.
+    """
+    min_chars = config.TTS_PIPELINE_MIN_CHARS if min_chars is None else min_chars
+    semaphore = asyncio.Semaphore(parallelism or config.TTS_PIPELINE_PARALLELISM)
+    out: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+    pending_audio: "asyncio.Queue[Optional[Tuple[int, str, asyncio.Future[CachedAudio]]]]" = asyncio.Queue()
+    tasks: List["asyncio.Future[CachedAudio]"] = []
+
+    async def one(i: int, sentence: str) -> CachedAudio:
+        async with semaphore:
+            return await synthesize_speech(sentence, voice, with_style=(i == 0))
+
+    def submit(sentence: str) -> None:
+        task = asyncio.ensure_future(one(len(tasks), sentence))
+        pending_audio.put_nowait((len(tasks), sentence, task))
+        tasks.append(task)
+
+    async def read_chunks() -> None:
+        segmenter = StreamSegmenter("sentence")
+        pending = ""
+        try:
+            async for chunk in chunks:
+                out.put_nowait(("text", chunk))
+                for sentence in segmenter.feed(chunk):
+                    pending += sentence
+                    if len(pending) >= min_chars:
+                        submit(pending)
+                        pending = ""
+            for sentence in segmenter.flush():
+                pending += sentence
+            if pending:
+                submit(pending)
+        finally:
+            pending_audio.put_nowait(None)
+
+    async def emit_audio() -> None:
+        while True:
+            item = await pending_audio.get()
+            if item is None:
+                return
+            i, sentence, task = item
+            try:
+                audio, error = await task, None
+            except Exception as e:
+                audio, error = None, e
+            out.put_nowait(("audio", (i, sentence, audio, error)))
+
+    reader = asyncio.ensure_future(read_chunks())
+    emitter = asyncio.ensure_future(emit_audio())
+    emitter.add_done_callback(lambda _: out.put_nowait(None))
+    try:
+        while True:
+            event = await out.get()
+            if event is None:
+                break
+            yield event
+        await emitter
+        await reader  # re-raise a failed chat stream
+    finally:
+        for task in (reader, emitter, *tasks):
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()
+
+
+async def synthesize_batch(
+    items: List[Tuple[str, str]],
+    parallelism: Optional[int] = None,
+) -> AsyncIterator[Tuple[List[int], Optional[CachedAudio], Optional[BaseException]]]:
+    """Synthesize (text, voice) items concurrently (bounded), in completion order.
+
+    Identical items are synthesized once; each result is yielded with every
+    request index that asked for it. A failing item yields its exception
+    instead of aborting the batch.
+    """
+    indices: Dict[Tuple[str, str], List[int]] = {}
+    for i, item in enumerate(items):
+        indices.setdefault(item, []).append(i)
+    semaphore = asyncio.Semaphore(parallelism or config.TTS_BATCH_PARALLELISM)
+
+    async def one(item: Tuple[str, str]) -> Tuple[Tuple[str, str], Optional[CachedAudio], Optional[BaseException]]:
+        async with semaphore:
+            try:
+                return item, await synthesize_speech(*item), None
+            except Exception as e:
+                return item, None, e
+
+    tasks = [asyncio.ensure_future(one(item)) for item in indices]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            item, audio, error = await next_done
+            yield indices[item], audio, error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def prewarm_items(characters: Optional[List[str]] = None) -> List[Tuple[str, str]]:
+    """(text, voice) pairs worth having in the TTS cache.
+
+    Configured greetings for every voice come first, then the MockLLM lines
+    of each character taken round-robin, so a partial run still covers
+    every character.
+    """
+    from app.vendors.mock_llm import phrase_corpus
+
+    corpus = phrase_corpus()
+    voices = [v for v in (characters or list(qiniu_tts.VOICE_MAPPING)) if v in qiniu_tts.VOICE_MAPPING]
+    limit = config.TTS_PREWARM_MAX_PER_CHARACTER
+    lines = {v: corpus.get(v, [])[:limit] if limit else corpus.get(v, []) for v in voices}
+    items: Dict[Tuple[str, str], None] = {}
+    for greeting in config.TTS_PREWARM_GREETINGS:
+        for voice in voices:
+            items[(greeting, voice)] = None
+    for i in range(max((len(v) for v in lines.values()), default=0)):
+        for voice in voices:
+            if i < len(lines[voice]):
+                items[(lines[voice][i], voice)] = None
+    return list(items)
+
+
+# 后台预热 TTS 缓存：低优先级，只在 TTS 上游有空闲时按限速合成
+tts_prewarmer = Prewarmer(synthesize_speech, speech_cached, limiters["tts"], config.TTS_PREWARM_RATE)
+
+
+# ASR 上传前的 WAV 预处理（下混、裁静音、重采样）
+asr_preprocessor = WavPreprocessor(
+    target_rate=config.ASR_TARGET_SAMPLE_RATE,
+    threshold_db=config.ASR_VAD_THRESHOLD_DB,
+    pad_ms=config.ASR_VAD_PAD_MS,
+)
+
+
+@dataclass(frozen=True)
+class Transcript:
+    text: str
+    # (start ms, end ms, text) per transcribed segment; one segment unless split
+    segments: Tuple[Tuple[int, int, str], ...] = ()
+
+
+class InvalidAudioError(ValueError):
+    """The audio is empty or not in a format the ASR upstream can take; nothing was sent."""
+
+
+# 识别结果按音频内容哈希缓存；相同音频并发上传时只调用一次上游
+asr_cache: TTLCache[str, Transcript] = TTLCache(config.ASR_CACHE_MAX_ENTRIES, config.ASR_CACHE_TTL)
+asr_flight: SingleFlight[Transcript] = SingleFlight()
+
+EMPTY_TRANSCRIPT = Transcript("")
+
+# 大音频先上传到对象存储，ASR 请求里只带 URL
+asr_storage = create_storage(
+    config.ASR_STORAGE_BACKEND,
+    directory=config.ASR_STORAGE_DIR,
+    base_url=config.ASR_STORAGE_BASE_URL,
+    access_key=config.ASR_STORAGE_ACCESS_KEY,
+    secret_key=config.ASR_STORAGE_SECRET_KEY,
+    bucket=config.ASR_STORAGE_BUCKET,
+    domain=config.ASR_STORAGE_DOMAIN,
+    part_size=config.ASR_STORAGE_PART_MB * 1024 * 1024,
+)
+asr_uploads = StoredAudio(asr_storage, config.ASR_STORAGE_URL_TTL) if asr_storage else None
+
+
+async def transcribe(audio: Union[bytes, AudioUpload], audio_base64: Optional[str] = None) -> str:
+    """Recognized text of an audio clip ("" for silent clips); see transcribe_segments."""
+    return (await transcribe_segments(audio, audio_base64)).text
+
+
+async def transcribe_segments(audio: Union[bytes, AudioUpload], audio_base64: Optional[str] = None) -> Transcript:
+    """Recognized text of an audio clip, with per-segment timestamps.
+
+    The headers are checked locally first: empty, unrecognised or broken
+    audio raises InvalidAudioError and never reaches the upstream. Results are cached by a digest of the audio bytes
+    and identical concurrent uploads share one upstream call. On a miss,
+    PCM WAV clips longer than ASR_LONG_AUDIO_SECONDS are split at pauses
+    and the segments transcribed concurrently; other WAV clips are shrunk
+    by the pre-processor, and the format sent upstream is detected from the
+    magic bytes. Pass `audio_base64` when the caller already has the encoded
+    form; an AudioUpload is encoded while it streams to the upstream.
+    """
+    if not (audio.size if isinstance(audio, AudioUpload) else len(audio)):
+        raise InvalidAudioError("audio is empty")
+    info, key = await asyncio.to_thread(_with_buffer, audio, _inspect)
+    if info.format == "unknown":
+        raise InvalidAudioError("unrecognized audio format")
+    if info.format in ("mp3", "wav") and not info.duration_ms:
+        print(f"ASR rejected invalid {info.format} upload: {'; '.join(info.issues)}")
+        raise InvalidAudioError(f"invalid {info.format} audio: {'; '.join(info.issues) or 'no audio data'}")
+    if info.issues:
+        print(f"ASR upload warnings: {'; '.join(info.issues)}")
+    if config.ASR_CACHE_ENABLED:
+        cached = asr_cache.get(key)
+        if cached is not None:
+            print(f"ASR cache hit: {key}")
+            return cached
+    # the shared call holds its own reference: it may outlive this request's upload
+    return await asr_flight.run(
+        key, lambda: holding(audio, lambda: _transcribe_uncached(key, info, audio, audio_base64))
+    )
+
+
+async def _transcribe_uncached(
+    key: str,
+    info: AudioInfo,
+    audio: Union[bytes, AudioUpload],
+    audio_base64: Optional[str],
+) -> Transcript:
+    if (config.ASR_PREPROCESS_ENABLED and info.format == "wav"
+            and info.duration_ms > config.ASR_LONG_AUDIO_SECONDS * 1000):
+        segments = await asyncio.to_thread(_with_buffer, audio, _split, info)
+        if segments is not None:
+            transcript = await _transcribe_split(segments)
+            if config.ASR_CACHE_ENABLED and transcript.text:
+                asr_cache.set(key, transcript)
+            return transcript
+
+    processed = await asyncio.to_thread(_with_buffer, audio, _preprocess, info)
+    if isinstance(audio, AudioUpload):
+        audio_format = guess_format(audio.head(), audio.content_type)
+        size = audio.size
+    else:
+        audio_format = guess_format(audio[:64])
+        size = len(audio)
+    duration = info.duration_ms
+    if processed is not None:
+        print(f"ASR preprocess: {size} -> {len(processed)} bytes")
+        if len(processed) <= WAV_HEADER_SIZE:
+            print("ASR skipped: upload contains only silence")
+            if config.ASR_CACHE_ENABLED:
+                asr_cache.set(key, EMPTY_TRANSCRIPT)
+            return EMPTY_TRANSCRIPT
+        text = await _recognize(processed, "wav")
+    else:
+        text = await _recognize(audio, audio_format, audio_base64, digest=key)
+    transcript = Transcript(text, ((0, duration, text),) if text else ())
+    # 空结果可能是上游偶发问题，不缓存
+    if text and config.ASR_CACHE_ENABLED:
+        asr_cache.set(key, transcript)
+    return transcript
+
+
+async def _recognize(
+    audio: Union[bytes, AudioUpload],
+    audio_format: str,
+    audio_base64: Optional[str] = None,
+    digest: Optional[str] = None,
+) -> str:
+    """One upstream ASR call: clips above ASR_UPLOAD_THRESHOLD_KB go by URL, others inline."""
+    size = audio.size if isinstance(audio, AudioUpload) else len(audio)
+    threshold = config.ASR_UPLOAD_THRESHOLD_KB * 1024
+    if asr_uploads is not None and threshold > 0 and size > threshold:
+        url = await asr_uploads.url_for(audio, audio_format, digest)
+        response_data = await qiniu_asr.recognize_url(url, audio_format)
+    else:
+        if isinstance(audio, AudioUpload):
+            payload: Union[str, AudioUpload] = audio
+        else:
+            payload = audio_base64 if audio_base64 is not None else base64.b64encode(audio).decode("ascii")
+        response_data = await qiniu_asr.recognize(payload, audio_format)
+    print(f"Full response: {response_data}")
+    return qiniu_asr.recognized_text(response_data)
+
+
+async def _transcribe_split(segments: List[Tuple[int, int, bytes]]) -> Transcript:
+    """Transcribe segments concurrently (bounded by the ASR limiter) and stitch them in order."""
+    print(f"ASR long audio: {len(segments)} segments")
+    texts = await asyncio.gather(*(
+        _recognize(wav, "wav") for _, _, wav in segments
+    ))
+    pieces = []
+    timed = []
+    for i, ((start, end, _), text) in enumerate(zip(segments, texts)):
+        overlaps = i > 0 and start < segments[i - 1][1]
+        pieces.append((text, overlaps))
+        if text.strip():
+            timed.append((start, end, text.strip()))
+    return Transcript(join_transcripts(pieces), tuple(timed))
+
+
+def _with_buffer(audio: Union[bytes, AudioUpload], fn: Callable[..., T], *args: Any) -> T:
+    if isinstance(audio, AudioUpload):
+        with audio.buffer() as view:
+            return fn(view, *args)
+    return fn(audio, *args)
+
+
+def _split(data: Buffer, info: AudioInfo) -> Optional[List[Tuple[int, int, bytes]]]:
+    return asr_preprocessor.split(data, info, config.ASR_SEGMENT_SECONDS, config.ASR_SEGMENT_OVERLAP_MS)
+
+
+def _inspect(data: Buffer) -> Tuple[AudioInfo, str]:
+    return probe_audio(data), audio_digest(data)
 
 
+def _preprocess(data: Buffer, info: AudioInfo) -> Optional[bytes]:
+    if config.ASR_PREPROCESS_ENABLED and info.format == "wav":
+        return asr_preprocessor.process(data, info)
+    return None
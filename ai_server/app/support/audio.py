@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Bitrates in kbps, indexed by [version is MPEG1][layer][bitrate index]
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates indexed by version bits (0: MPEG2.5, 2: MPEG2, 3: MPEG1)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+# Give up resyncing after this much garbage in a row
+_MAX_RESYNC = 64 * 1024
+
+
+@dataclass
+class AudioInfo:
+    format: str  # "mp3", "wav" or a detected container name, "unknown" otherwise
+    duration_ms: int = 0
+    bitrate_kbps: int = 0  # average
+    sample_rate: int = 0
+    channels: int = 0
+    frames: int = 0
+    bits_per_sample: int = 0  # WAV only
+    codec: int = 0  # WAV format tag (1 = PCM, 3 = IEEE float)
+    start: int = 0  # offset of the first audio byte (after tags / headers)
+    end: int = 0  # offset just past the last complete frame / sample
+    truncated: bool = False
+    corrupt: bool = False
+    issues: List[str] = field(default_factory=list)
+
+
+def detect_format(data: Buffer) -> str:
+    """Container format from magic bytes."""
+    head = bytes(data[:16])
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:3] == b"ID3":
+        return "mp3"
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:
+        # the layer bits are 00 in AAC (ADTS) headers, reserved in MPEG audio
+        return "mp3" if head[1] & 0x06 else "aac"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[4:8] == b"ftyp":
+        return "m4a"
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        return "webm"
+    if head[:6] == b"#!AMR\n":
+        return "amr"
+    return "unknown"
+
+
+def _id3v2_size(data: Buffer) -> int:
+    if len(data) >= 10 and bytes(data[:3]) == b"ID3":
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        return 10 + size + (10 if data[5] & 0x10 else 0)
+    return 0
+
+
+def _frame_header(data: Buffer, pos: int):
+    """(frame length, samples, sample rate, bitrate kbps, channels) or None."""
+    if pos + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03  # 0: 2.5, 1: reserved, 2: MPEG2, 3: MPEG1
+    layer = 4 - ((b1 >> 1) & 0x03)  # 1..3, 4 means reserved
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index]
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    channels = 1 if (b3 >> 6) == 3 else 2
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or mpeg1) else 576
+        length = samples // 8 * bitrate * 1000 // sample_rate + padding
+    return length, samples, sample_rate, bitrate, channels
+
+
+def parse_mp3(data: Buffer) -> AudioInfo:
+    """Walk MP3 frame headers (one jump per frame, not per byte).
+
+    Computes exact duration from the frame count, detects a truncated last
+    frame and garbage between frames, and reports where the last complete
+    frame ends so trailing padding or partial frames can be cut off.
+    """
+    info = AudioInfo("mp3")
+    size = len(data)
+    # a trailing ID3v1 tag is not audio
+    if size >= 128 and bytes(data[size - 128:size - 125]) == b"TAG":
+        size -= 128
+    pos = info.start = _id3v2_size(data)
+    total_samples = 0
+    total_bytes = 0
+    first = True
+    while pos < size:
+        header = _frame_header(data, pos)
+        if header is None:
+            nxt = _resync(data, pos + 1, size)
+            if nxt is None:
+                if not _is_padding(data, pos, size):
+                    info.issues.append(f"{size - pos} trailing bytes are not audio")
+                break
+            info.corrupt = info.corrupt or not first or nxt - pos > 4096
+            info.issues.append(f"skipped {nxt - pos} bytes of garbage at {pos}")
+            pos = nxt
+            continue
+        length, samples, sample_rate, bitrate, channels = header
+        if pos + length > size:
+            info.truncated = True
+            info.issues.append(f"last frame truncated ({size - pos} of {length} bytes)")
+            break
+        if first:
+            info.start, info.sample_rate, info.channels = pos, sample_rate, channels
+            first = False
+            if _is_xing(data, pos, length):
+                pos += length  # VBR info frame: metadata, no audio
+                continue
+        info.frames += 1
+        total_samples += samples
+        total_bytes += length
+        pos += length
+        info.end = pos
+    if info.frames and info.sample_rate:
+        info.duration_ms = total_samples * 1000 // info.sample_rate
+        info.bitrate_kbps = round(total_bytes * 8 / (total_samples / info.sample_rate) / 1000)
+    elif not info.issues:
+        info.issues.append("no MPEG audio frames found")
+    return info
+
+
+def _resync(data: Buffer, pos: int, size: int) -> Optional[int]:
+    limit = min(size, pos + _MAX_RESYNC)
+    raw = data if hasattr(data, "find") else bytes(data)  # bytes / mmap search in place
+    while pos < limit:
+        pos = raw.find(b"\xff", pos, limit)
+        if pos == -1:
+            return None
+        header = _frame_header(raw, pos)
+        if header is not None and (pos + header[0] >= size or _frame_header(raw, pos + header[0]) is not None):
+            return pos
+        pos += 1
+    return None
+
+
+def _is_padding(data: Buffer, pos: int, size: int) -> bool:
+    tail = bytes(data[pos:size])
+    return not tail.strip(b"\x00") or not tail.strip(b"\xff")
+
+
+def _is_xing(data: Buffer, pos: int, length: int) -> bool:
+    frame = bytes(data[pos:pos + min(length, 64)])
+    return b"Xing" in frame or b"Info" in frame or b"VBRI" in frame
+
+
+def parse_wav(data: Buffer) -> AudioInfo:
+    info = AudioInfo("wav")
+    size = len(data)
+    if size < 12 or bytes(data[:4]) != b"RIFF" or bytes(data[8:12]) != b"WAVE":
+        info.corrupt = True
+        info.issues.append("not a RIFF/WAVE file")
+        return info
+    pos = 12
+    byte_rate = block_align = 0
+    while pos + 8 <= size:
+        chunk_id = bytes(data[pos:pos + 4])
+        (chunk_size,) = struct.unpack_from("<I", data, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt " and body + 16 <= size:
+            codec, channels, sample_rate, byte_rate, block_align, bits = struct.unpack_from("<HHIIHH", data, body)
+            if codec == 0xFFFE and chunk_size >= 40 and body + 26 <= size:
+                (codec,) = struct.unpack_from("<H", data, body + 24)  # WAVE_FORMAT_EXTENSIBLE sub-format
+            info.channels, info.sample_rate = channels, sample_rate
+            info.bits_per_sample, info.codec = bits, codec
+        elif chunk_id == b"data":
+            available = size - body
+            if chunk_size > available or chunk_size in (0, 0xFFFFFFFF) and available:
+                if chunk_size not in (0, 0xFFFFFFFF):
+                    info.truncated = True
+                    info.issues.append(f"data chunk truncated ({available} of {chunk_size} bytes)")
+                chunk_size = available
+            if block_align:
+                chunk_size -= chunk_size % block_align
+            info.start, info.end = body, body + chunk_size
+            if byte_rate:
+                info.duration_ms = chunk_size * 1000 // byte_rate
+                info.bitrate_kbps = byte_rate * 8 // 1000
+                info.frames = chunk_size // block_align if block_align else 0
+            else:
+                info.corrupt = True
+                info.issues.append("data chunk before fmt chunk")
+            return info
+        pos = body + chunk_size + (chunk_size & 1)
+    info.corrupt = True
+    info.issues.append("no data chunk")
+    return info
+
+
+def probe_audio(data: Buffer) -> AudioInfo:
+    """Parse MP3/WAV headers; other containers are only identified."""
+    fmt = detect_format(data)
+    if fmt == "mp3":
+        return parse_mp3(data)
+    if fmt == "wav":
+        return parse_wav(data)
+    return AudioInfo(fmt)
+
+
+def strip_id3(data: bytes) -> bytes:
+    """Drop a leading ID3v2 tag and a trailing ID3v1 tag from an MP3 clip."""
+    start = _id3v2_size(data)
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return data[start:end] if start or end != len(data) else data
+
+
+def concat_mp3(clips: Iterable[bytes]) -> bytes:
+    """Join MP3 clips frame-wise, dropping their ID3 tags so no tag ends up mid-stream."""
+    return b"".join(strip_id3(clip) for clip in clips if clip)
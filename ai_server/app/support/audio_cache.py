@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:  # optional, a non-cryptographic hash several times faster than blake2b
+    import xxhash
+
+    def audio_digest(data: Any) -> str:
+        """Digest of raw audio bytes (any buffer: bytes, memoryview, mmap)."""
+        return xxhash.xxh3_128_hexdigest(data)
+except ImportError:  # pragma: no cover - depends on the environment
+    def audio_digest(data: Any) -> str:
+        """Digest of raw audio bytes (any buffer: bytes, memoryview, mmap)."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedAudio:
+    data: bytes
+    format: str
+    duration: int  # milliseconds
+
+
+def content_key(*params: Any) -> str:
+    """Content address of a synthesis: hash of every parameter that shapes the audio."""
+    raw = json.dumps(params, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class _MemoryTier:
+    """LRU bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items: "OrderedDict[str, CachedAudio]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def put(self, key: str, audio: CachedAudio) -> None:
+        if len(audio.data) > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old.data)
+        self._items[key] = audio
+        self.bytes += len(audio.data)
+        while self.bytes > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.bytes -= len(evicted.data)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class AudioCache:
+    """Two-tier content-addressed audio cache.
+
+    Hot clips live in an in-memory LRU; every clip is also written to
+    `directory` as `<key[:2]>/<key>_<duration>.<format>`, so the file name
+    alone is enough to rebuild the disk index at boot. Disk reads are one
+    read() in a worker thread and promote the clip to memory. The disk tier is
+    bounded by total bytes and evicts least recently used files.
+    """
+
+    def __init__(self, directory: Optional[Path], memory_max_bytes: int, disk_max_bytes: int) -> None:
+        self.directory = directory
+        self.memory = _MemoryTier(memory_max_bytes)
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_bytes = 0
+        # key -> (path, size, duration, format), in LRU order
+        self._disk: "OrderedDict[str, Tuple[Path, int, int, str]]" = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.disk_errors = 0
+
+    # ---- index ----
+
+    def _scan(self) -> "OrderedDict[str, Tuple[Path, int, int, str]]":
+        entries = []
+        assert self.directory is not None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # leftovers of writes cut short by a crash, never renamed into place
+        self._unlink_all(list(self.directory.glob("*/*.tmp")))
+        for path in self.directory.glob("*/*_*.*"):
+            stem, _, fmt = path.name.rpartition(".")
+            if fmt == "tmp":
+                continue
+            key, _, duration = stem.rpartition("_")
+            try:
+                st = path.stat()
+                entries.append((st.st_atime, key, (path, st.st_size, int(duration), fmt)))
+            except (OSError, ValueError):
+                continue
+        entries.sort()
+        return OrderedDict((key, entry) for _, key, entry in entries)
+
+    async def load_index(self) -> int:
+        """Warm start: rebuild the disk index from the files already on disk."""
+        if self.directory is None:
+            return 0
+        try:
+            index = await asyncio.to_thread(self._scan)
+        except OSError as e:
+            logger.warning("Audio cache disabled on disk, cannot use %s: %s", self.directory, e)
+            self.directory = None
+            return 0
+        self._disk = index
+        self.disk_bytes = sum(entry[1] for entry in index.values())
+        await self._evict_disk()
+        logger.info("Audio cache index loaded: %d clips, %d bytes", len(self._disk), self.disk_bytes)
+        return len(self._disk)
+
+    # ---- lookups ----
+
+    @staticmethod
+    def _read(path: Path) -> bytes:
+        # a single read into a bytes object of the file's size, no extra copy
+        return path.read_bytes()
+
+    async def get(self, key: str) -> Optional[CachedAudio]:
+        audio = self.memory.get(key)
+        if audio is not None:
+            self.memory_hits += 1
+            return audio
+        entry = self._disk.get(key)
+        if entry is not None:
+            path, _, duration, fmt = entry
+            try:
+                data = await asyncio.to_thread(self._read, path)
+            except (OSError, ValueError) as e:
+                self.disk_errors += 1
+                logger.warning("Audio cache read failed for %s: %s", path, e)
+                self._forget(key)
+            else:
+                self._disk.move_to_end(key)
+                audio = CachedAudio(data, fmt, duration)
+                self.memory.put(key, audio)
+                self.disk_hits += 1
+                return audio
+        self.misses += 1
+        return None
+
+    def contains(self, key: str) -> bool:
+        return self.memory.get(key) is not None or key in self._disk
+
+    async def put(self, key: str, audio: CachedAudio) -> None:
+        if not audio.data:
+            return
+        self.memory.put(key, audio)
+        if self.directory is None or key in self._disk:
+            return
+        path = self.directory / key[:2] / f"{key}_{audio.duration}.{audio.format}"
+        try:
+            await asyncio.to_thread(self._write, path, audio.data)
+        except OSError as e:
+            self.disk_errors += 1
+            logger.warning("Audio cache write failed for %s: %s", path, e)
+            return
+        self._disk[key] = (path, len(audio.data), audio.duration, audio.format)
+        self.disk_bytes += len(audio.data)
+        await self._evict_disk()
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write + rename so readers never map a half-written file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _forget(self, key: str) -> Optional[Path]:
+        entry = self._disk.pop(key, None)
+        if entry is None:
+            return None
+        self.disk_bytes -= entry[1]
+        return entry[0]
+
+    async def _evict_disk(self) -> None:
+        doomed = []
+        while self.disk_bytes > self.disk_max_bytes and self._disk:
+            key = next(iter(self._disk))
+            path = self._forget(key)
+            if path is not None:
+                doomed.append(path)
+        if doomed:
+            await asyncio.to_thread(self._unlink_all, doomed)
+
+    @staticmethod
+    def _unlink_all(paths: list) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memoryEntries": len(self.memory),
+            "memoryBytes": self.memory.bytes,
+            "diskEntries": len(self._disk),
+            "diskBytes": self.disk_bytes,
+            "memoryHits": self.memory_hits,
+            "diskHits": self.disk_hits,
+            "misses": self.misses,
+            "hitRate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "diskErrors": self.disk_errors,
+        }
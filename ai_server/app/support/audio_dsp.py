@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.support.audio import AudioInfo, Buffer
+
+# numpy is optional and only needed for the ASR pre-processing stage; it
+# takes ~100 ms to import, so it is loaded on first use, not at startup
+np: Any = None
+_numpy_missing = False
+
+# WAV format tags
+PCM = 1
+IEEE_FLOAT = 3
+
+# dtype and full-scale value per (format tag, bits per sample)
+_SAMPLE_TYPES = {
+    (PCM, 8): ("u1", 128.0),
+    (PCM, 16): ("<i2", 32768.0),
+    (PCM, 32): ("<i4", 2147483648.0),
+    (IEEE_FLOAT, 32): ("<f4", 1.0),
+}
+
+WAV_HEADER_SIZE = 44
+
+# Anti-aliasing filter length (odd, so the filter has no delay)
+_FIR_TAPS = 63
+
+# A cut without a pause needs a stretch this much (dB) under the window's median
+_MIN_DIP_DB = 6.0
+
+
+def available() -> bool:
+    """Whether numpy can be used; imports it on the first call."""
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - depends on the environment
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np is not None
+
+
+def wav_header(sample_rate: int, channels: int, bits: int, data_size: int) -> bytes:
+    """Canonical PCM WAV header (WAV_HEADER_SIZE bytes)."""
+    block_align = channels * bits // 8
+    return (
+        b"RIFF" + struct.pack("<I", 36 + data_size) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, PCM, channels, sample_rate, sample_rate * block_align, block_align, bits)
+        + b"data" + struct.pack("<I", data_size)
+    )
+
+
+def encode_wav(mono: "np.ndarray", rate: int) -> bytes:
+    """16-bit mono WAV from float samples in [-1, 1]."""
+    pcm = (np.clip(mono, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+    return wav_header(rate, 1, 16, len(pcm)) + pcm
+
+
+def _lowpass(cutoff: float) -> "np.ndarray":
+    """Windowed-sinc low-pass FIR; `cutoff` in cycles per sample."""
+    n = np.arange(_FIR_TAPS) - (_FIR_TAPS - 1) / 2
+    taps = np.sinc(2 * cutoff * n) * np.blackman(_FIR_TAPS)
+    return (taps / taps.sum()).astype(np.float32)
+
+
+class WavPreprocessor:
+    """Shrink PCM WAV clips before ASR: downmix, trim silence, resample.
+
+    Stereo is averaged to mono, leading and trailing frames whose RMS stays
+    below both `threshold_db` (dBFS) and `relative_db` under the loudest
+    frame are cut (keeping `pad_ms` around the speech), and anything above
+    `target_rate` is low-passed and resampled to it. Everything is
+    vectorized over the samples; the input is read in place through
+    np.frombuffer. Non-PCM or already minimal clips are left alone.
+    """
+
+    def __init__(
+        self,
+        target_rate: int = 16000,
+        threshold_db: float = -45.0,
+        relative_db: float = 35.0,
+        frame_ms: int = 20,
+        pad_ms: int = 200,
+    ) -> None:
+        self.target_rate = target_rate
+        self.threshold_db = threshold_db
+        self.relative_db = relative_db
+        self.frame_ms = frame_ms
+        self.pad_ms = pad_ms
+
+        # metrics; process() runs in worker threads, so they are updated under a lock
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.skipped = 0
+        self.silent = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds_in = 0.0
+        self.seconds_out = 0.0
+        self.total_time = 0.0
+
+    def decode(self, data: Buffer, info: AudioInfo) -> "Optional[np.ndarray]":
+        """Mono float32 samples in [-1, 1] at the clip's own rate, or None if unsupported."""
+        sample_type = _SAMPLE_TYPES.get((info.codec, info.bits_per_sample))
+        if (info.format != "wav" or sample_type is None or not info.channels
+                or not info.sample_rate or info.end <= info.start or not available()):
+            return None
+        dtype, full_scale = sample_type
+        channels = info.channels
+        count = (info.end - info.start) // np.dtype(dtype).itemsize // channels * channels
+        raw = np.frombuffer(data, dtype=dtype, count=count, offset=info.start).reshape(-1, channels)
+        mono = raw.mean(axis=1, dtype=np.float32) if channels > 1 else raw[:, 0].astype(np.float32)
+        return (mono - 128.0) / full_scale if dtype == "u1" else mono / full_scale
+
+    def process(self, data: Buffer, info: AudioInfo) -> Optional[bytes]:
+        """A smaller 16-bit mono WAV, or None when the clip cannot or need not shrink.
+
+        An all-silent clip comes back as a WAV without samples.
+        """
+        started = time.perf_counter()
+        mono = self.decode(data, info)
+        if mono is None:
+            with self._lock:
+                self.skipped += 1
+            return None
+        rate = info.sample_rate
+        start, end = self._speech_bounds(mono, rate)
+        mono = mono[start:end]
+        if rate > self.target_rate and len(mono):
+            mono = self._resample(mono, rate, self.target_rate)
+            rate = self.target_rate
+
+        out = encode_wav(mono, rate)
+        original = len(data)
+        if len(out) > WAV_HEADER_SIZE and len(out) >= original:
+            with self._lock:
+                self.skipped += 1
+            return None
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.processed += 1
+            self.silent += len(out) <= WAV_HEADER_SIZE
+            self.bytes_in += original
+            self.bytes_out += len(out)
+            self.seconds_in += info.duration_ms / 1000
+            self.seconds_out += len(mono) / rate
+            self.total_time += elapsed
+        return out
+
+    def split(
+        self,
+        data: Buffer,
+        info: AudioInfo,
+        max_segment_s: float,
+        overlap_ms: int,
+    ) -> "Optional[List[Tuple[int, int, bytes]]]":
+        """Cut a long clip into (start ms, end ms, 16-bit mono WAV) segments at pauses.
+
+        Each cut goes to the middle of the last pause (100 ms average below
+        the speech threshold) between a quarter and all of the allowed
+        segment length. Without a pause it goes to the quietest stretch there
+        if that is a real dip, else at the full segment length. When a cut is
+        not in a pause, both neighbours get `overlap_ms` of each other so a
+        word on the cut is heard whole by at least one of them. Silent
+        segments are dropped. Returns None for clips `decode` does not support.
+        """
+        mono = self.decode(data, info)
+        if mono is None:
+            return None
+        rate = info.sample_rate
+        if rate > self.target_rate:
+            mono = self._resample(mono, rate, self.target_rate)
+            rate = self.target_rate
+        frame = max(1, rate * self.frame_ms // 1000)
+        level = self._frame_levels(mono, frame)
+        if len(level) == 0:
+            return [(0, len(mono) * 1000 // rate, encode_wav(mono, rate))]
+        threshold = max(self.threshold_db, float(level.max()) - self.relative_db)
+        smooth = np.convolve(level, np.ones(5) / 5, mode="same")
+
+        max_frames = max(2, int(max_segment_s * 1000 / self.frame_ms))
+        overlap = rate * overlap_ms // 1000
+        cuts: List[Tuple[int, bool]] = []  # (sample index, cut lands in a pause)
+        pos = 0
+        while len(level) - pos > max_frames:
+            lo = pos + max_frames // 4
+            window = smooth[lo:pos + max_frames]
+            quiet = np.flatnonzero(window <= threshold)
+            if len(quiet):
+                # middle of the last pause in the window: long segments, cut in silence
+                run_start = len(quiet) - 1
+                while run_start and quiet[run_start - 1] == quiet[run_start] - 1:
+                    run_start -= 1
+                best = lo + int(quiet[run_start] + quiet[-1]) // 2
+            else:
+                dip = int(np.argmin(window))
+                # nothing clearly quieter than the rest (steady speech): use the whole segment
+                if window[dip] > float(np.median(window)) - _MIN_DIP_DB:
+                    dip = len(window) - 1
+                best = lo + dip
+            cuts.append((best * frame + frame // 2, bool(smooth[best] <= threshold)))
+            pos = best + 1
+
+        segments = []
+        bounds = [(0, True)] + cuts + [(len(mono), True)]
+        for (start, quiet_start), (end, quiet_end) in zip(bounds, bounds[1:]):
+            lo = start if quiet_start else max(0, start - overlap)
+            hi = end if quiet_end else min(len(mono), end + overlap)
+            if not (level[start // frame:max(start // frame + 1, end // frame)] > threshold).any():
+                continue  # nothing but silence
+            segments.append((lo * 1000 // rate, hi * 1000 // rate, encode_wav(mono[lo:hi], rate)))
+        return segments
+
+    @staticmethod
+    def _frame_levels(mono: "np.ndarray", frame: int) -> "np.ndarray":
+        """Per-frame energy in dBFS."""
+        frames = len(mono) // frame
+        blocks = mono[:frames * frame].reshape(frames, frame)
+        return 10 * np.log10(np.einsum("ij,ij->i", blocks, blocks) / frame + 1e-12)
+
+    def _speech_bounds(self, mono: "np.ndarray", rate: int) -> "tuple[int, int]":
+        frame = max(1, rate * self.frame_ms // 1000)
+        level = self._frame_levels(mono, frame)
+        if len(level) == 0:
+            return 0, len(mono)
+        threshold = max(self.threshold_db, float(level.max()) - self.relative_db)
+        voiced = np.flatnonzero(level > threshold)
+        if len(voiced) == 0:
+            return 0, 0
+        pad = rate * self.pad_ms // 1000
+        return max(0, int(voiced[0]) * frame - pad), min(len(mono), (int(voiced[-1]) + 1) * frame + pad)
+
+    @staticmethod
+    def _resample(mono: "np.ndarray", rate: int, target: int) -> "np.ndarray":
+        filtered = np.convolve(mono, _lowpass(0.45 * target / rate), mode="same")
+        positions = np.arange(int(len(mono) * target / rate), dtype=np.float64) * (rate / target)
+        return np.interp(positions, np.arange(len(mono)), filtered).astype(np.float32)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> Dict[str, Any]:
+        return {
+            "available": available(),
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "silent": self.silent,
+            "bytesIn": self.bytes_in,
+            "bytesOut": self.bytes_out,
+            "bytesSaved": self.bytes_in - self.bytes_out,
+            "savedRatio": round(1 - self.bytes_out / self.bytes_in, 4) if self.bytes_in else 0.0,
+            "secondsIn": round(self.seconds_in, 2),
+            "secondsOut": round(self.seconds_out, 2),
+            "avgMs": round(self.total_time / self.processed * 1000, 2) if self.processed else 0.0,
+        }
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Dict, List, Optional
+
+
+class TickClock:
+    """Coarse shared timer for very many concurrent sleepers.
+
+    Deadlines are rounded up to the next multiple of `tick` seconds and all
+    sleepers due in the same tick are woken together by one loop timer
+    callback. Ten thousand streams pacing themselves at 100 Hz cost
+    about 200 timer callbacks per second instead of a million timer
+    handles pushed through the loop's heap.
+    """
+
+    def __init__(self, tick: float = 0.005) -> None:
+        self.tick = max(0.001, tick)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buckets: Dict[int, List["asyncio.Future[None]"]] = {}
+
+        # metrics
+        self.sleeps = 0
+        self.timers = 0
+
+    def time(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    async def sleep_until(self, deadline: float) -> None:
+        """Sleep until loop time `deadline` (at most one tick late)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # futures belong to one loop; drop anything left from a previous one
+            self._loop = loop
+            self._buckets = {}
+        if deadline <= loop.time():
+            await asyncio.sleep(0)
+            return
+        slot = math.ceil(deadline / self.tick)
+        waiters = self._buckets.get(slot)
+        if waiters is None:
+            waiters = self._buckets[slot] = []
+            loop.call_at(slot * self.tick, self._fire, slot)
+            self.timers += 1
+        # one future per sleeper: cancelling a sleeper leaves the others alone
+        fut = loop.create_future()
+        waiters.append(fut)
+        self.sleeps += 1
+        await fut
+
+    async def sleep(self, delay: float) -> None:
+        await self.sleep_until(self.time() + delay)
+
+    def _fire(self, slot: int) -> None:
+        for fut in self._buckets.pop(slot, ()):
+            if not fut.done():
+                fut.set_result(None)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "tickMs": round(self.tick * 1000, 3),
+            "pending": len(self._buckets),
+            "sleeps": self.sleeps,
+            "timers": self.timers,
+            "sleepsPerTimer": round(self.sleeps / self.timers, 2) if self.timers else 0.0,
+        }
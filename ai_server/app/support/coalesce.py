@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight call among concurrent callers with the same key.
+
+    The call runs as its own task, so a caller that gives up (e.g. a client
+    disconnect) does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, "asyncio.Future[T]"] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.shared += 1
+            return await asyncio.shield(fut)
+
+        fut = asyncio.ensure_future(factory())
+        self._inflight[key] = fut
+        self.calls += 1
+
+        def _done(f: "asyncio.Future[T]") -> None:
+            if self._inflight.get(key) is f:
+                del self._inflight[key]
+            if not f.cancelled():
+                f.exception()  # mark as retrieved even if every waiter left
+
+        fut.add_done_callback(_done)
+        return await asyncio.shield(fut)
+
+    def stats(self) -> Dict[str, int]:
+        return {"inFlight": len(self._inflight), "calls": self.calls, "shared": self.shared}
+
+
+class _Broadcast(Generic[T]):
+    def __init__(self) -> None:
+        self.items: List[T] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.cond = asyncio.Condition()
+        self.subscribers = 0
+        self.task: Optional["asyncio.Task[None]"] = None
+
+
+class StreamCoalescer(Generic[T]):
+    """Fan one upstream async stream out to every concurrent identical request.
+
+    The first caller starts the upstream producer; callers arriving while it
+    runs replay what was produced so far and then follow it live. Once the
+    stream ends the key is released, so later callers start a fresh one.
+    If every subscriber leaves early the upstream stream is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, _Broadcast[T]] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def stream(self, key: Hashable, factory: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        b = self._inflight.get(key)
+        if b is None:
+            b = _Broadcast()
+            self._inflight[key] = b
+            b.task = asyncio.create_task(self._pump(key, b, factory))
+            self.calls += 1
+        else:
+            self.shared += 1
+        b.subscribers += 1
+
+        pos = 0
+        try:
+            while True:
+                async with b.cond:
+                    while pos >= len(b.items) and not b.done:
+                        await b.cond.wait()
+                    pending = b.items[pos:]
+                    finished = b.done
+                for item in pending:
+                    pos += 1
+                    yield item
+                if finished and pos >= len(b.items):
+                    if b.error is not None:
+                        raise b.error
+                    return
+        finally:
+            b.subscribers -= 1
+            if b.subscribers == 0 and not b.done and b.task is not None:
+                self._release(key, b)
+                b.task.cancel()
+
+    async def _pump(self, key: Hashable, b: _Broadcast[T], factory: Callable[[], AsyncIterator[T]]) -> None:
+        try:
+            async for item in factory():
+                async with b.cond:
+                    b.items.append(item)
+                    b.cond.notify_all()
+        except asyncio.CancelledError:
+            # subscribers still waiting get an error; the cancel itself propagates
+            b.error = RuntimeError("upstream stream cancelled")
+            raise
+        except Exception as e:
+            b.error = e
+        finally:
+            self._release(key, b)
+            async with b.cond:
+                b.done = True
+                b.cond.notify_all()
+
+    def _release(self, key: Hashable, b: _Broadcast[Any]) -> None:
+        if self._inflight.get(key) is b:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"inFlight": len(self._inflight), "calls": self.calls, "shared": self.shared}
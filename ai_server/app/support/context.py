@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import config
+
+Message = Dict[str, str]
+# (previous summary, newly dropped turns) -> new summary
+Summarizer = Callable[[str, List[Message]], Awaitable[str]]
+
+# Rough per-message framing overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_CJK_RE = re.compile(r"[\u3000-\u303f\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]")
+_WORD_RE = re.compile(r"[A-Za-z0-9_]+|[^\sA-Za-z0-9_]")
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text: str) -> int:
+    """Cheap token estimate without a tokenizer dependency.
+
+    CJK characters are roughly one token each; latin words are ~4 chars/token.
+    Memoized, so a growing history only pays for the new messages.
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    rest = _CJK_RE.sub(" ", text)
+    tokens = cjk
+    for piece in _WORD_RE.findall(rest):
+        tokens += max(1, (len(piece) + 3) // 4)
+    return tokens
+
+
+def count_message_tokens(message: Message) -> int:
+    return count_tokens(message.get("content", "")) + MESSAGE_OVERHEAD_TOKENS
+
+
+def budget_for_model(model: str) -> int:
+    return config.CONTEXT_TOKEN_BUDGETS.get(model, config.CONTEXT_TOKEN_BUDGET)
+
+
+def _digest(messages: List[Message]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for m in messages:
+        h.update(m.get("role", "").encode("utf-8"))
+        h.update(b"\x00")
+        h.update(m.get("content", "").encode("utf-8"))
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+async def extractive_summary(previous: str, turns: List[Message]) -> str:
+    """Default summarizer: keep the first sentence of each dropped turn."""
+    lines = [previous] if previous else []
+    for m in turns:
+        content = m.get("content", "").strip()
+        if not content:
+            continue
+        first = re.split(r"(?<=[。！？.!?])", content, maxsplit=1)[0].strip()
+        speaker = "User" if m.get("role") == "user" else "Assistant"
+        lines.append(f"{speaker}: {first}")
+    return "\n".join(lines)
+
+
+def _clip_to_tokens(text: str, max_tokens: int) -> str:
+    """Keep the most recent part of the summary within max_tokens."""
+    if count_tokens(text) <= max_tokens:
+        return text
+    lines = text.split("\n")
+    while len(lines) > 1 and count_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    clipped = "\n".join(lines)
+    while clipped and count_tokens(clipped) > max_tokens:
+        clipped = clipped[len(clipped) // 4 or 1:]
+    return clipped
+
+
+@dataclass
+class _SummaryState:
+    summarized: int  # number of leading history messages covered by `summary`
+    digest: str  # digest of those messages, to detect edited/foreign histories
+    summary: str
+
+
+class ContextManager:
+    """Fit a conversation into a per-model token budget.
+
+    The system prompt and the current user turn are always kept; history is
+    kept newest-first while it fits, and the older turns that do not fit are
+    folded into a rolling summary cached per conversation, so each request
+    only summarizes the turns dropped since the previous one.
+    """
+
+    def __init__(
+        self,
+        summarizer: Summarizer = extractive_summary,
+        max_conversations: int = 1024,
+    ) -> None:
+        self.summarizer = summarizer
+        self.max_conversations = max_conversations
+        self._summaries: "OrderedDict[str, _SummaryState]" = OrderedDict()
+
+    async def build_messages(
+        self,
+        *,
+        conversation_id: str,
+        model: str,
+        system: str,
+        history: List[Message],
+        user_text: str,
+    ) -> List[Message]:
+        budget = budget_for_model(model) - config.CONTEXT_REPLY_RESERVE
+        system_msg = {"role": "system", "content": system}
+        user_msg = {"role": "user", "content": user_text}
+        used = count_message_tokens(system_msg) + count_message_tokens(user_msg)
+
+        total_history = sum(count_message_tokens(m) for m in history)
+        if used + total_history <= budget:
+            return [system_msg, *history, user_msg]
+
+        # Something has to go: reserve room for the summary, then keep the
+        # newest turns that still fit.
+        summary_budget = min(config.CONTEXT_SUMMARY_TOKENS, max(0, budget - used))
+        remaining = budget - used - summary_budget
+        keep_from = len(history)
+        while keep_from > 0:
+            cost = count_message_tokens(history[keep_from - 1])
+            if cost > remaining:
+                break
+            remaining -= cost
+            keep_from -= 1
+
+        kept = history[keep_from:]
+        dropped = history[:keep_from]
+        summary = await self._summarize(conversation_id, dropped, summary_budget)
+
+        if summary:
+            # Folded into the system prompt: some compatible APIs only accept
+            # a single leading system message.
+            system_msg = {"role": "system", "content": f"{system}\n\n# Earlier conversation (summary)\n{summary}"}
+        return [system_msg, *kept, user_msg]
+
+    async def _summarize(self, conversation_id: str, dropped: List[Message], max_tokens: int) -> str:
+        if not dropped or max_tokens <= 0:
+            return ""
+        state = self._summaries.get(conversation_id)
+        previous, start = "", 0
+        if (
+            state is not None
+            and state.summarized <= len(dropped)
+            and state.digest == _digest(dropped[: state.summarized])
+        ):
+            if state.summarized == len(dropped):
+                self._summaries.move_to_end(conversation_id)
+                return state.summary
+            previous, start = state.summary, state.summarized
+
+        summary = _clip_to_tokens(await self.summarizer(previous, dropped[start:]), max_tokens)
+        self._summaries[conversation_id] = _SummaryState(len(dropped), _digest(dropped), summary)
+        self._summaries.move_to_end(conversation_id)
+        while len(self._summaries) > self.max_conversations:
+            self._summaries.popitem(last=False)
+        return summary
+
+
+def conversation_key(role: str, session_id: Optional[str], history: List[Message]) -> str:
+    """Stable id for the rolling-summary cache when no session id is given."""
+    if session_id:
+        return f"{role}:{session_id}"
+    return f"{role}:{_digest(history[:2])}"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import httpx
+
+import config
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_client() -> httpx.AsyncClient:
+    """Build the pooled client shared by the LLM, TTS and ASR upstream calls.
+
+    Per-call read timeouts are passed at request time (the LLM stream has none,
+    TTS/ASR use 30s), so the client only fixes connect and pool timeouts.
+    """
+    http2 = config.HTTP2_ENABLED and _http2_available()
+    if config.HTTP2_ENABLED and not http2:
+        logger.warning("HTTP/2 requested but h2 is not installed, falling back to HTTP/1.1")
+    limits = httpx.Limits(
+        max_connections=config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(
+        30.0,
+        connect=config.HTTP_CONNECT_TIMEOUT,
+        pool=config.HTTP_POOL_TIMEOUT,
+    )
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+
+async def startup() -> None:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+
+
+async def shutdown() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily outside the app lifespan."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Deque, Dict, Optional
+
+import httpx
+
+import config
+
+
+class UpstreamBusyError(RuntimeError):
+    """No upstream slot could be obtained (queue full, deadline hit or 429)."""
+
+    def __init__(self, vendor: str, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(f"{vendor}: {message}")
+        self.vendor = vendor
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class UpstreamLimiter:
+    """Per-vendor concurrency cap + token bucket with a bounded FIFO wait queue.
+
+    On 429 the limiter halves its effective concurrency and pauses new
+    requests for Retry-After (or an exponential backoff); every
+    `recover_after` successful calls the limit grows back by one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        rate: float = 0.0,
+        burst: Optional[float] = None,
+        max_queue: int = 100,
+        queue_timeout: float = 10.0,
+        recover_after: int = 10,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate = rate  # tokens per second, 0 disables the bucket
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.recover_after = recover_after
+
+        self._limit = self.max_concurrency
+        self._active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = 0.0
+        self._successes = 0
+
+        # metrics
+        self.acquired = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    # ---- concurrency slots ----
+
+    def _wake_next(self) -> None:
+        while self._waiters and self._active < self._limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._active += 1
+                fut.set_result(None)
+
+    async def _acquire_slot(self, deadline: float) -> None:
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise UpstreamBusyError(self.name, "wait queue is full", self._retry_hint())
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await asyncio.wait_for(asyncio.shield(fut), max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            self._abandon(fut)
+            self.rejected += 1
+            raise UpstreamBusyError(self.name, "timed out waiting for a slot", self._retry_hint())
+        except BaseException:
+            self._abandon(fut)
+            raise
+
+    def _abandon(self, fut: "asyncio.Future[None]") -> None:
+        if fut.done() and not fut.cancelled():
+            self._release_slot()  # granted just as the waiter gave up
+            return
+        fut.cancel()
+        try:
+            self._waiters.remove(fut)
+        except ValueError:
+            pass
+
+    def _release_slot(self) -> None:
+        self._active -= 1
+        self._wake_next()
+
+    # ---- token bucket / pause ----
+
+    async def _wait_for_token(self, deadline: float) -> None:
+        while True:
+            now = time.monotonic()
+            delay = self._paused_until - now
+            if delay <= 0 and self.rate > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            elif delay <= 0:
+                return
+            if now + delay > deadline:
+                self.rejected += 1
+                raise UpstreamBusyError(self.name, "rate limited", self._retry_hint())
+            await asyncio.sleep(delay)
+
+    def _retry_hint(self) -> float:
+        return max(1.0, self._paused_until - time.monotonic())
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator["UpstreamLimiter"]:
+        """Hold one upstream slot for the duration of the block."""
+        started = time.monotonic()
+        deadline = started + (self.queue_timeout if timeout is None else timeout)
+        await self._acquire_slot(deadline)
+        try:
+            await self._wait_for_token(deadline)
+            waited = time.monotonic() - started
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            yield self
+        finally:
+            self._release_slot()
+
+    def idle_slots(self) -> int:
+        """Slots a new caller would get right now (0 while queued or paused)."""
+        if self._waiters or self._paused_until > time.monotonic():
+            return 0
+        return max(0, self._limit - self._active)
+
+    # ---- feedback from responses ----
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapt to the upstream answer; raises UpstreamBusyError on 429."""
+        if response.status_code == 429:
+            self.throttled += 1
+            self._successes = 0
+            self._limit = max(1, self._limit // 2)
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is None:
+                self._backoff = min(30.0, self._backoff * 2 if self._backoff else 1.0)
+                retry_after = self._backoff
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            raise UpstreamBusyError(self.name, "upstream returned 429", retry_after)
+        if response.status_code < 500:
+            self._backoff = 0.0
+            self._successes += 1
+            if self._limit < self.max_concurrency and self._successes >= self.recover_after:
+                self._successes = 0
+                self._limit += 1
+                self._wake_next()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": self._limit,
+            "maxConcurrency": self.max_concurrency,
+            "inFlight": self._active,
+            "queued": len(self._waiters),
+            "maxQueueDepth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+            "avgWaitMs": round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0,
+            "maxWaitMs": round(self.max_wait * 1000, 2),
+            "pausedForMs": round(max(0.0, self._paused_until - time.monotonic()) * 1000, 1),
+        }
+
+
+def _make(name: str, concurrency: int, rate: float) -> UpstreamLimiter:
+    return UpstreamLimiter(
+        name,
+        max_concurrency=concurrency,
+        rate=rate,
+        max_queue=config.UPSTREAM_MAX_QUEUE,
+        queue_timeout=config.UPSTREAM_QUEUE_TIMEOUT,
+    )
+
+
+limiters: Dict[str, UpstreamLimiter] = {
+    "llm": _make("llm", config.LLM_MAX_CONCURRENCY, config.LLM_RATE_PER_SEC),
+    "tts": _make("tts", config.TTS_MAX_CONCURRENCY, config.TTS_RATE_PER_SEC),
+    "asr": _make("asr", config.ASR_MAX_CONCURRENCY, config.ASR_RATE_PER_SEC),
+}
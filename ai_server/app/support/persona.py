@@ -1,25 +1,123 @@
+import asyncio
+import logging
 import os
 from pathlib import Path
 
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+from app.support.prompt import build_system_prompt
 
-def load_persona(role: Optional[str]) -> str:
-    safe = (role or "default").strip().lower() or "default"
-    filenames = [f"{safe}.md", "default.md"]
-    
-    # Get the directory where this file is located
-    current_dir = Path(__file__).parent.parent
-    personas_dir = current_dir / "personas"
-    
-    for name in filenames:
-        file_path = personas_dir / name
-        if file_path.exists():
+logger = logging.getLogger(__name__)
+
+PERSONAS_DIR = Path(__file__).parent.parent / "personas"
+FALLBACK_PERSONA = "You are a helpful AI assistant. Answer briefly in Chinese."
+
+
+class Persona:
+    def __init__(self, character_id: str, text: str, mtime: float) -> None:
+        self.character_id = character_id
+        self.text = text
+        self.mtime = mtime
+        self.system_prompt = build_system_prompt(text)
+
+
+class PersonaRegistry:
+    """All personas loaded once, with their finished system prompts.
+
+    Lookups never touch the disk. A background task re-scans the directory
+    every `interval` seconds in a worker thread and swaps in changed files;
+    listeners are called with the character id of every changed persona.
+    """
+
+    def __init__(self, directory: Path = PERSONAS_DIR) -> None:
+        self.directory = directory
+        self._personas: Dict[str, Persona] = {}
+        self._fallback = Persona("default", FALLBACK_PERSONA, 0.0)
+        self._loaded = False
+        self._listeners: List[Callable[[str], None]] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        self._listeners.append(callback)
+
+    def _scan(self) -> Tuple[Dict[str, Persona], List[str]]:
+        """Blocking: read new or modified files. Returns (personas, changed ids)."""
+        current: Dict[str, Persona] = {}
+        changed: List[str] = []
+        for file_path in sorted(self.directory.glob("*.md")):
+            character_id = file_path.stem.lower()
             try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception:
+                mtime = file_path.stat().st_mtime
+                old = self._personas.get(character_id)
+                if old is not None and old.mtime == mtime:
+                    current[character_id] = old
+                    continue
+                text = file_path.read_text(encoding="utf-8")
+            except OSError as e:
+                logger.warning("Failed to load persona %s: %s", file_path, e)
+                if character_id in self._personas:
+                    current[character_id] = self._personas[character_id]
                 continue
-    return "You are a helpful AI assistant. Answer briefly in Chinese."
+            current[character_id] = Persona(character_id, text, mtime)
+            changed.append(character_id)
+        changed.extend(cid for cid in self._personas if cid not in current)
+        return current, changed
+
+    def _apply(self, personas: Dict[str, Persona], changed: List[str]) -> None:
+        first_load = not self._loaded
+        self._personas = personas
+        self._loaded = True
+        if first_load:
+            return
+        for character_id in changed:
+            logger.info("Persona reloaded: %s", character_id)
+            for callback in self._listeners:
+                callback(character_id)
+
+    def load(self) -> None:
+        self._apply(*self._scan())
+
+    async def reload(self) -> List[str]:
+        personas, changed = await asyncio.to_thread(self._scan)
+        self._apply(personas, changed)
+        return changed
+
+    async def _watch(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.warning("Persona reload failed: %s", e)
+
+    async def start(self, interval: float) -> None:
+        await self.reload()
+        if interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._watch(interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get(self, role: Optional[str]) -> Persona:
+        if not self._loaded:
+            # Used outside the app lifespan (scripts): load synchronously once
+            self.load()
+        safe = (role or "default").strip().lower() or "default"
+        return self._personas.get(safe) or self._personas.get("default") or self._fallback
+
+    def system_prompt(self, role: Optional[str]) -> str:
+        return self.get(role).system_prompt
+
+    def characters(self) -> List[str]:
+        if not self._loaded:
+            self.load()
+        return sorted(self._personas)
 
 
+personas = PersonaRegistry()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.support.limiter import UpstreamBusyError, UpstreamLimiter
+
+logger = logging.getLogger(__name__)
+
+Item = Tuple[str, str]  # (text, voice)
+
+
+class Prewarmer:
+    """Low-priority background job that runs items through a cache-filling call.
+
+    Items already cached are skipped without an upstream call. The rest are
+    paced to at most `rate` calls per second and only start while the
+    upstream limiter has spare slots (one is always left for live traffic
+    when the limit allows it), so live requests never queue behind the job.
+    """
+
+    def __init__(
+        self,
+        warm: Callable[[str, str], Awaitable[Any]],
+        is_cached: Callable[[str, str], bool],
+        limiter: UpstreamLimiter,
+        rate: float,
+        poll_interval: float = 0.5,
+    ) -> None:
+        self.warm = warm
+        self.is_cached = is_cached
+        self.limiter = limiter
+        self.rate = rate
+        self.poll_interval = poll_interval
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._reset(0)
+
+    def _reset(self, total: int) -> None:
+        self.total = total
+        self.warmed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, items: List[Item]) -> bool:
+        """Start a run in the background; False if one is already running."""
+        if self.running:
+            return False
+        self._reset(len(items))
+        self.started_at = time.time()
+        self._task = asyncio.create_task(self._run(items))
+        return True
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _wait_for_spare_slot(self) -> None:
+        reserve = 2 if self.limiter.max_concurrency > 1 else 1
+        while self.limiter.idle_slots() < reserve:
+            await asyncio.sleep(self.poll_interval)
+
+    async def _run(self, items: List[Item]) -> None:
+        interval = 1.0 / self.rate if self.rate > 0 else 0.0
+        try:
+            for text, voice in items:
+                if self.is_cached(text, voice):
+                    self.skipped += 1
+                    continue
+                await self._wait_for_spare_slot()
+                started = time.monotonic()
+                try:
+                    await self.warm(text, voice)
+                    self.warmed += 1
+                except UpstreamBusyError as e:
+                    self.failed += 1
+                    await asyncio.sleep(e.retry_after or self.poll_interval)
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning("Prewarm failed for %r (%s): %s", text, voice, e)
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+        finally:
+            self.finished_at = time.time()
+            logger.info(
+                "Prewarm %s: %d warmed, %d already cached, %d failed of %d",
+                "finished" if self.warmed + self.skipped + self.failed == self.total else "stopped",
+                self.warmed, self.skipped, self.failed, self.total,
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "total": self.total,
+            "warmed": self.warmed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "remaining": max(0, self.total - self.warmed - self.skipped - self.failed),
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+        }
@@ -12,3 +12,6 @@ def build_prompt(persona: str, user_text: str) -> str:
     )
 
 
+def build_system_prompt(persona: str) -> str:
+    """Persona and instructions only, without the conversation scaffolding."""
+    return build_prompt(persona, "").split("# Conversation", 1)[0].strip()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import re
+from typing import (
+    AsyncIterable, AsyncIterator, Dict, FrozenSet, Iterable, Iterator, List, Pattern, Sequence, Tuple,
+)
+
+# Every character that ends a chunk in the original word-level loop
+WORD_BOUNDARY = " \t\n\r,.!?，。！？；：、"
+
+_PATTERNS: Dict[str, Pattern[str]] = {
+    # Split after whitespace and any punctuation (the streaming chat chunks)
+    "word": re.compile("[" + re.escape(WORD_BOUNDARY) + "]"),
+    # Split after punctuation and line breaks, keep spaces inside a clause
+    "clause": re.compile(r"[,，;；:：、。！？!?…\n]+|\.(?=\s)"),
+    # Split after sentence-ending punctuation (plus closing quotes), for TTS
+    "sentence": re.compile(r"(?:[。！？!?；;…\n]+|\.(?=\s))[”’\"」』）)]*"),
+}
+
+GRANULARITIES = tuple(_PATTERNS)
+
+# Below this size a plain character loop beats setting up a regex scan
+_SMALL_DELTA = 24
+
+_NO_SEGMENTS: Sequence[str] = ()
+
+
+class StreamSegmenter:
+    """Cut a stream of text deltas into stripped segments.
+
+    A segment ends right after a boundary and includes it; whitespace-only
+    segments are dropped. With "word" granularity the output is identical
+    to the old per-character loop over WORD_BOUNDARY.
+
+    Only the new delta is scanned, plus a short carry-over from the previous
+    one: a trailing "." (its boundary depends on the next character) and, for
+    "sentence", a boundary at the very end of the buffer, held back until the
+    next delta shows whether closing quotes follow. Text between boundaries
+    is kept as a list of pieces and joined once per segment, and short deltas
+    with single-character boundaries take a plain character loop.
+    """
+
+    __slots__ = ("granularity", "_parts", "_carry", "_finditer", "_hold_back", "_boundary_chars")
+
+    def __init__(self, granularity: str = "word") -> None:
+        if granularity not in _PATTERNS:
+            raise ValueError(f"Unknown granularity {granularity!r}, expected one of {GRANULARITIES}")
+        self.granularity = granularity
+        self._parts: List[str] = []
+        self._carry = ""
+        self._finditer = _PATTERNS[granularity].finditer
+        self._hold_back = granularity == "sentence"
+        # Single-character boundaries allow the cheap loop for short deltas
+        self._boundary_chars: FrozenSet[str] = frozenset(WORD_BOUNDARY) if granularity == "word" else frozenset()
+
+    def feed(self, delta: str) -> Sequence[str]:
+        boundary = self._boundary_chars
+        if boundary:
+            if boundary.isdisjoint(delta):
+                self._parts.append(delta)
+                return _NO_SEGMENTS
+            if len(delta) <= _SMALL_DELTA:
+                return self._feed_chars(delta)
+
+        text = self._carry + delta if self._carry else delta
+        segments = _NO_SEGMENTS
+        start = 0
+        carry_from = len(text)
+        for match in self._finditer(text):
+            end = match.end()
+            if end == len(text) and self._hold_back:
+                carry_from = match.start()  # closing quotes may still follow in the next delta
+                break
+            piece = self._take(text[start:end])
+            if piece:
+                if segments is _NO_SEGMENTS:
+                    segments = []
+                segments.append(piece)  # type: ignore[attr-defined]
+            start = end
+        if start < carry_from == len(text) and text.endswith("."):
+            carry_from -= 1  # "." only ends a clause when whitespace follows
+        if start < carry_from:
+            self._parts.append(text[start:carry_from])
+        self._carry = text[carry_from:]
+        return segments
+
+    def _feed_chars(self, delta: str) -> Sequence[str]:
+        boundary = self._boundary_chars
+        segments = _NO_SEGMENTS
+        start = 0
+        end = 0
+        for ch in delta:
+            end += 1
+            if ch in boundary:
+                piece = self._take(delta[start:end])
+                if piece:
+                    if segments is _NO_SEGMENTS:
+                        segments = []
+                    segments.append(piece)  # type: ignore[attr-defined]
+                start = end
+        if start < len(delta):
+            self._parts.append(delta[start:])
+        return segments
+
+    def _take(self, tail: str) -> str:
+        """The stripped segment ending with `tail`; empties the buffer."""
+        parts = self._parts
+        if not parts:
+            return tail.strip()
+        parts.append(tail)
+        piece = "".join(parts).strip()
+        parts.clear()
+        return piece
+
+    def flush(self) -> Sequence[str]:
+        piece = self._take(self._carry)
+        self._carry = ""
+        return [piece] if piece else _NO_SEGMENTS
+
+
+def segment_stream(deltas: Iterable[str], granularity: str = "word") -> Iterator[str]:
+    segmenter = StreamSegmenter(granularity)
+    for delta in deltas:
+        yield from segmenter.feed(delta)
+    yield from segmenter.flush()
+
+
+_WORD_BOUNDARY_CHARS = frozenset(WORD_BOUNDARY)
+
+
+async def iter_words(deltas: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Words of a streamed chat reply, the same as StreamSegmenter("word").
+
+    An inline per-character loop rather than a feed() call per delta: at the
+    1-4 character deltas LLMs stream, the call overhead would dominate.
+    """
+    boundary = _WORD_BOUNDARY_CHARS
+    buffer = ""
+    async for delta in deltas:
+        for ch in delta:
+            buffer += ch
+            if ch in boundary:
+                word = buffer.strip()
+                if word:
+                    yield word
+                buffer = ""
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def split_text(text: str, granularity: str = "sentence") -> List[str]:
+    """Segment a complete text in one go."""
+    return list(segment_stream([text], granularity))
+
+
+# Punctuation an ASR result may put around a cut that the neighbour does not repeat
+_EDGE_PUNCTUATION = " \t\n\r,.!?;:，。！？；：、…"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+def _overlap(left: str, right: str, max_chars: int, min_chars: int) -> int:
+    """Length of the longest prefix of `right` that repeats the end of `left`.
+
+    Ignores punctuation at the end of `left`; for Latin text the match must
+    start and end on word boundaries.
+    """
+    left = left.rstrip(_EDGE_PUNCTUATION)
+    for k in range(min(len(left), len(right), max_chars), min_chars - 1, -1):
+        if not left.endswith(right[:k]):
+            continue
+        if _is_word_char(right[0]) and k < len(left) and _is_word_char(left[-k - 1]):
+            continue
+        if _is_word_char(right[k - 1]) and k < len(right) and _is_word_char(right[k]):
+            continue
+        return k
+    return 0
+
+
+def join_transcripts(
+    pieces: Iterable[Tuple[str, bool]],
+    max_overlap: int = 32,
+    min_overlap: int = 2,
+) -> str:
+    """Join per-segment transcripts in order.
+
+    `pieces` are (text, overlaps previous): where the audio of two segments
+    overlapped, the words heard twice are dropped from the second one.
+    Latin text gets a space at the joint, CJK text none.
+    """
+    out = ""
+    for text, overlaps in pieces:
+        text = text.strip()
+        if out and overlaps and text:
+            text = text[_overlap(out, text, max_overlap, min_overlap):].lstrip(_EDGE_PUNCTUATION)
+        if not text:
+            continue
+        if out and (_is_word_char(text[0]) or text[0] in "\"'(") and out[-1].isascii() and not out[-1].isspace():
+            out += " "
+        out += text
+    return out
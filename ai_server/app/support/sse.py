@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+try:  # optional, several times faster and parses bytes directly
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover - depends on the environment
+    def json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+@dataclass
+class SSEEvent:
+    event: str
+    data: bytes
+    id: Optional[str] = None
+
+
+class SSEDecoder:
+    """Incremental Server-Sent Events decoder working on raw bytes.
+
+    Feed it chunks as they arrive from the socket; it returns the events
+    completed by that chunk. Lines may end with LF, CRLF or CR (also when the
+    terminator is split across chunks), `data:` lines of one event are joined
+    with LF, and comment lines (`:` prefix) are ignored. Payloads stay bytes
+    so they can go straight into the JSON decoder.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._data: List[bytes] = []
+        self._event = b""
+        self._id: Optional[bytes] = None
+        self._seen_first_line = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        buf = self._buf
+        buf += chunk
+        events: List[SSEEvent] = []
+        start = 0
+        size = len(buf)
+        while start < size:
+            lf = buf.find(b"\n", start)
+            stop = lf if lf != -1 else size
+            cr = buf.find(b"\r", start, stop)
+            if cr != -1:
+                if cr == size - 1:
+                    break  # could be the first half of a CRLF
+                end = cr
+                nxt = cr + 2 if buf[cr + 1] == 0x0A else cr + 1
+            elif lf != -1:
+                end = lf
+                nxt = lf + 1
+            else:
+                break
+            self._line(bytes(buf[start:end]), events)
+            start = nxt
+        if start:
+            del buf[:start]
+        return events
+
+    def close(self) -> List[SSEEvent]:
+        """Flush a trailing event that was not terminated by a blank line."""
+        events: List[SSEEvent] = []
+        if self._buf:
+            self._line(bytes(self._buf.rstrip(b"\r")), events)
+            self._buf.clear()
+        self._line(b"", events)
+        return events
+
+    def _line(self, line: bytes, events: List[SSEEvent]) -> None:
+        if not self._seen_first_line:
+            self._seen_first_line = True
+            if line.startswith(b"\xef\xbb\xbf"):
+                line = line[3:]
+        if not line:
+            if self._data:
+                events.append(SSEEvent(
+                    event=self._event.decode("utf-8", "replace") or "message",
+                    data=b"\n".join(self._data),
+                    id=self._id.decode("utf-8", "replace") if self._id is not None else None,
+                ))
+            self._data = []
+            self._event = b""
+            return
+        if line[0] == 0x3A:  # ":" comment / keep-alive
+            return
+        field, sep, value = line.partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value
+        elif field == b"id":
+            self._id = value
+        # "retry" and unknown fields are ignored
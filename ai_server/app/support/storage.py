@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Union
+
+from app.support.audio_cache import audio_digest
+from app.support.cache import TTLCache
+from app.support.coalesce import SingleFlight
+from app.support.upload import AudioUpload, holding
+
+logger = logging.getLogger(__name__)
+
+Source = Union[bytes, AudioUpload]
+
+AUDIO_CONTENT_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "ogg": "audio/ogg", "m4a": "audio/mp4"}
+
+
+class StorageError(RuntimeError):
+    pass
+
+
+class ObjectStorage(Protocol):
+    async def put(self, key: str, source: Source, content_type: str) -> None: ...
+
+    def url(self, key: str, expires: int) -> str: ...
+
+
+class LocalStorage:
+    """Directory stand-in for the bucket (tests, single-host setups).
+
+    The upstream fetches the audio itself, so `base_url` must be where a
+    static file server publishes `directory`; URLs are `base_url/key`.
+    """
+
+    def __init__(self, directory: Path, base_url: str) -> None:
+        if not base_url:
+            raise ValueError("LocalStorage needs a base URL the ASR service can fetch from")
+        self.directory = directory
+        self.base_url = base_url.rstrip("/")
+
+    async def put(self, key: str, source: Source, content_type: str) -> None:
+        await asyncio.to_thread(self._write, self.directory / key, source)
+
+    @staticmethod
+    def _write(path: Path, source: Source) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if isinstance(source, AudioUpload):
+                    with source.buffer() as view:
+                        f.write(view)
+                else:
+                    f.write(source)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def url(self, key: str, expires: int) -> str:
+        return f"{self.base_url}/{key}"
+
+
+class QiniuStorage:
+    """Qiniu Kodo bucket through the official SDK.
+
+    Small objects go up in one request; spooled uploads are streamed with
+    the v2 multipart (resumable) protocol in `part_size` pieces. The SDK
+    keeps one requests session per process, so connections are reused.
+    Download URLs are signed, which works for private and public buckets.
+    """
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        bucket: str,
+        domain: str,
+        part_size: int = 4 * 1024 * 1024,
+    ) -> None:
+        import qiniu  # the SDK is only needed when the bucket is actually used
+
+        self._qiniu = qiniu
+        self.auth = qiniu.Auth(access_key, secret_key)
+        self.bucket = bucket
+        self.domain = domain if "://" in domain else f"http://{domain}"
+        self.part_size = part_size
+
+    async def put(self, key: str, source: Source, content_type: str) -> None:
+        await asyncio.to_thread(self._put, key, source, content_type)
+
+    def _put(self, key: str, source: Source, content_type: str) -> None:
+        token = self.auth.upload_token(self.bucket, key, 3600)
+        if isinstance(source, AudioUpload) and source.size > self.part_size:
+            source.file.seek(0)
+            ret, info = self._qiniu.put_stream(
+                token, key, source.file, key, source.size,
+                mime_type=content_type, part_size=self.part_size, version="v2", bucket_name=self.bucket,
+            )
+        else:
+            if isinstance(source, AudioUpload):
+                source.file.seek(0)
+                source = source.file.read()
+            ret, info = self._qiniu.put_data(token, key, source, mime_type=content_type)
+        if ret is None or info.status_code != 200:
+            raise StorageError(f"Qiniu upload of {key} failed: {info.status_code} {info.text_body}")
+
+    def url(self, key: str, expires: int) -> str:
+        return self.auth.private_download_url(f"{self.domain}/{key}", expires=expires)
+
+
+class StoredAudio:
+    """Content-addressed uploads: each distinct clip goes to storage once.
+
+    Objects are named by a digest of their bytes, URLs are cached by that
+    digest (for a bit less than their signature lifetime) and concurrent
+    requests for the same clip share one upload.
+    """
+
+    def __init__(self, storage: ObjectStorage, url_ttl: int, max_entries: int = 4096, prefix: str = "asr") -> None:
+        self.storage = storage
+        self.url_ttl = url_ttl
+        self.prefix = prefix
+        self.urls: TTLCache[str, str] = TTLCache(max_entries, url_ttl * 0.9)
+        self.flight: SingleFlight[str] = SingleFlight()
+        self.uploads = 0
+        self.uploaded_bytes = 0
+        self.upload_time = 0.0
+
+    async def url_for(self, source: Source, audio_format: str, digest: Optional[str] = None) -> str:
+        """URL of the stored clip; pass `digest` when the caller already hashed it."""
+        if digest is None:
+            digest = await asyncio.to_thread(_digest, source)
+        url = self.urls.get(digest)
+        if url is not None:
+            return url
+        return await self.flight.run(
+            digest, lambda: holding(source, lambda: self._upload(digest, source, audio_format))
+        )
+
+    async def _upload(self, digest: str, source: Source, audio_format: str) -> str:
+        key = f"{self.prefix}/{digest[:2]}/{digest}.{audio_format}"
+        started = time.perf_counter()
+        await self.storage.put(key, source, AUDIO_CONTENT_TYPES.get(audio_format, "application/octet-stream"))
+        self.uploads += 1
+        self.uploaded_bytes += source.size if isinstance(source, AudioUpload) else len(source)
+        self.upload_time += time.perf_counter() - started
+        url = self.storage.url(key, self.url_ttl)
+        self.urls.set(digest, url)
+        return url
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.storage).__name__,
+            "uploads": self.uploads,
+            "uploadedBytes": self.uploaded_bytes,
+            "avgUploadMs": round(self.upload_time / self.uploads * 1000, 2) if self.uploads else 0.0,
+            "urlCache": self.urls.stats(),
+            "coalescing": self.flight.stats(),
+        }
+
+
+def _digest(source: Source) -> str:
+    if isinstance(source, AudioUpload):
+        with source.buffer() as view:
+            return audio_digest(view)
+    return audio_digest(source)
+
+
+def create_storage(
+    backend: str,
+    *,
+    directory: str = "",
+    base_url: str = "",
+    access_key: str = "",
+    secret_key: str = "",
+    bucket: str = "",
+    domain: str = "",
+    part_size: int = 4 * 1024 * 1024,
+) -> Optional[ObjectStorage]:
+    """Storage backend by name ("qiniu", "local", "none"); None if unusable.
+
+    Without a backend large clips are sent inline, as before.
+    """
+    if backend == "local":
+        if not base_url:
+            logger.warning("ASR_STORAGE_BASE_URL is not set, the ASR service could not fetch local files; "
+                           "large ASR uploads stay inline")
+            return None
+        return LocalStorage(Path(directory), base_url)
+    if backend == "qiniu":
+        if not (access_key and secret_key and bucket and domain):
+            logger.warning("Qiniu credentials are not set in the environment, large ASR uploads stay inline")
+            return None
+        try:
+            return QiniuStorage(access_key, secret_key, bucket, domain, part_size)
+        except ImportError:
+            logger.warning("qiniu SDK is not installed, large ASR uploads stay inline")
+            return None
+    return None
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import mmap
+from contextlib import contextmanager
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from app.support.audio import Buffer, detect_format
+
+T = TypeVar("T")
+
+# 3 * 64 KiB: a multiple of 3, so every chunk encodes to base64 without padding
+_B64_CHUNK = 3 * 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class AudioUpload:
+    """Uploaded audio held in a spooled temporary file.
+
+    Small clips stay in memory; larger ones roll over to disk, so memory per
+    request stays bounded. The content is read back through a memoryview or
+    mmap (no copies) and base64-encoded chunk by chunk, exactly once, while
+    it is sent upstream. The file is reference counted: whoever `retain()`s
+    it also calls `close()`, and the last `close()` closes the file.
+    """
+
+    def __init__(self, file: IO[bytes], size: int, content_type: str = "") -> None:
+        self.file = file
+        self.size = size
+        self.content_type = content_type
+        self._refs = 1
+
+    @classmethod
+    async def from_stream(
+        cls,
+        chunks: AsyncIterator[bytes],
+        max_bytes: int,
+        max_memory: int,
+        content_type: str = "",
+    ) -> "AudioUpload":
+        """Spool a request body; raises UploadTooLargeError past `max_bytes`."""
+        file = SpooledTemporaryFile(max_size=max_memory)
+        size = 0
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                if _on_disk(file):
+                    await asyncio.to_thread(file.write, chunk)
+                else:
+                    file.write(chunk)
+        except BaseException:
+            file.close()
+            raise
+        return cls(file, size, content_type)
+
+    @classmethod
+    def from_file(cls, file: IO[bytes], content_type: str = "") -> "AudioUpload":
+        """Wrap an already spooled file (e.g. a multipart part)."""
+        file.seek(0, 2)
+        return cls(file, file.tell(), content_type)
+
+    def head(self, size: int = 64) -> bytes:
+        self.file.seek(0)
+        return self.file.read(size)
+
+    @contextmanager
+    def buffer(self) -> Iterator[Buffer]:
+        """Zero-copy view of the content: a memoryview in memory, an mmap on disk."""
+        if self.size == 0:
+            yield b""
+            return
+        raw = _raw_file(self.file)
+        if hasattr(raw, "getbuffer"):
+            view = raw.getbuffer()
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+        raw.flush()
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+    @property
+    def base64_size(self) -> int:
+        return (self.size + 2) // 3 * 4
+
+    async def base64_chunks(self) -> AsyncIterator[bytes]:
+        """The content base64-encoded, streamed in fixed-size pieces."""
+        self.file.seek(0)
+        on_disk = _on_disk(self.file)
+        while True:
+            chunk = await asyncio.to_thread(self.file.read, _B64_CHUNK) if on_disk else self.file.read(_B64_CHUNK)
+            if not chunk:
+                return
+            yield base64.b64encode(chunk)
+
+    async def read(self) -> bytes:
+        self.file.seek(0)
+        return await asyncio.to_thread(self.file.read) if _on_disk(self.file) else self.file.read()
+
+    def retain(self) -> "AudioUpload":
+        """Take another reference, e.g. for a task that may outlive the request."""
+        if not self._refs:
+            raise ValueError("upload is already closed")
+        self._refs += 1
+        return self
+
+    def close(self) -> None:
+        if self._refs:
+            self._refs -= 1
+            if not self._refs:
+                self.file.close()
+
+
+def holding(source: Any, factory: Callable[[], Awaitable[T]]) -> Awaitable[T]:
+    """`factory()` run with its own reference to `source` when it is an AudioUpload.
+
+    For shared in-flight calls (SingleFlight): the reference is taken right
+    away, so the call still has the file when the request that started it
+    finishes or is cancelled first, and it is released when the call ends.
+    """
+    if not isinstance(source, AudioUpload):
+        return factory()
+    source.retain()
+
+    async def run() -> T:
+        try:
+            return await factory()
+        finally:
+            source.close()
+
+    return run()
+
+
+def _raw_file(file: IO[bytes]) -> IO[bytes]:
+    # SpooledTemporaryFile keeps a BytesIO or a real file in `_file`
+    return getattr(file, "_file", file)
+
+
+def _on_disk(file: IO[bytes]) -> bool:
+    return not hasattr(_raw_file(file), "getbuffer")
+
+
+def guess_format(head: bytes, content_type: Optional[str] = None) -> str:
+    """Upstream format name from magic bytes, falling back to the MIME subtype."""
+    fmt = detect_format(head)
+    if fmt != "unknown":
+        return fmt
+    subtype = (content_type or "").split(";")[0].strip().lower().rpartition("/")[2]
+    return {"mpeg": "mp3", "x-wav": "wav", "wave": "wav", "mp4": "m4a", "x-m4a": "m4a"}.get(subtype, subtype or "mp3")
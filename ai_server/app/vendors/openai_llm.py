@@ -1,18 +1,45 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Optional
 
 import httpx
 
+from app.support import http_pool
+from app.support.limiter import limiters
+from app.support.sse import SSEDecoder, json_loads
+import config
+
+
+class UpstreamStreamError(RuntimeError):
+    """The upstream reported an error inside an otherwise successful stream."""
+
+
+@dataclass
+class ChatDelta:
+    """One chat_events() item: a content delta, or the final summary event."""
+
+    content: str = ""
+    finish_reason: Optional[str] = None
+    usage: Optional[dict[str, Any]] = None
+    final: bool = False
+
 
 class OpenAILLM:
-    def __init__(self, api_key: str, model: str, base_url: str = "https://api.openai.com/v1") -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = "https://api.openai.com/v1",
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.api_key = api_key
         self.model = model
         self.base_url = base_url.rstrip("/")
+        # None means use the process-wide pooled client
+        self._client = client
         self.logger = logging.getLogger(__name__)
 
     def _get_base_headers(self) -> dict[str, str]:
@@ -40,34 +67,77 @@ class OpenAILLM:
                 new_headers[ks_ascii] = vs_ascii
         return new_headers
 
-    async def chat_stream(self, *, system: str, user: str) -> AsyncGenerator[str, None]:
+    async def chat_events(self, *, messages: list[dict[str, str]]) -> AsyncGenerator[ChatDelta, None]:
+        """Stream content deltas, then one final event with finish_reason and usage.
+
+        The final event is only sent when the stream ends normally; both of
+        its fields stay None if the upstream did not report them.
+        """
         url = f"{self.base_url}/chat/completions"
         headers = self._sanitize_headers(self._get_base_headers())
         payload = {
             "model": self.model,
             "stream": True,
-            "messages": [
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
+            "messages": messages,
         }
+        if config.OPENAI_STREAM_USAGE:
+            payload["stream_options"] = {"include_usage": True}
 
         # Debug log headers to ensure no Chinese characters
         self.logger.debug(f"Request headers: {headers}")
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            async with client.stream("POST", url, headers=headers, json=payload) as resp:
+        client = self._client or http_pool.get_client()
+        # No read timeout while streaming, but don't wait forever for a connection
+        timeout = httpx.Timeout(None, connect=config.HTTP_CONNECT_TIMEOUT, pool=config.HTTP_POOL_TIMEOUT)
+        decoder = SSEDecoder()
+        final = ChatDelta(final=True)
+        # The slot is held for the whole stream: it bounds concurrent generations
+        async with limiters["llm"].slot() as limiter:
+            async with client.stream("POST", url, headers=headers, json=payload, timeout=timeout) as resp:
+                limiter.observe(resp)
                 resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if not line or not line.startswith("data:"):
-                        continue
-                    if line.strip() == "data: [DONE]":
-                        break
-                    try:
-                        data = json.loads(line[len("data:"):].strip())
-                        delta = data["choices"][0]["delta"].get("content", "")
-                        if delta:
+                done = False
+                async for chunk in resp.aiter_bytes():
+                    for event in decoder.feed(chunk):
+                        if event.data == b"[DONE]":
+                            done = True
+                            break
+                        delta = self._parse_chunk(event.data, final)
+                        if delta is not None:
                             yield delta
-                    except Exception:
-                        continue
+                    if done:
+                        break
+                else:
+                    for event in decoder.close():
+                        if event.data != b"[DONE]":
+                            delta = self._parse_chunk(event.data, final)
+                            if delta is not None:
+                                yield delta
+        yield final
+
+    def _parse_chunk(self, data: bytes, final: ChatDelta) -> Optional[ChatDelta]:
+        """Content delta of one chunk; finish_reason and usage go into `final`."""
+        try:
+            obj = json_loads(data)
+        except ValueError:
+            self.logger.warning("Malformed stream chunk: %r", data[:200])
+            return None
+        if not isinstance(obj, dict):
+            self.logger.warning("Unexpected stream chunk: %r", data[:200])
+            return None
+        if obj.get("error"):
+            raise UpstreamStreamError(str(obj["error"]))
+        choices = obj.get("choices") or []
+        choice = choices[0] if choices else {}
+        if choice.get("finish_reason"):
+            final.finish_reason = choice["finish_reason"]
+        if obj.get("usage"):
+            final.usage = obj["usage"]
+        content = (choice.get("delta") or {}).get("content") or ""
+        return ChatDelta(content=content) if content else None
 
+    async def chat_stream(self, *, messages: list[dict[str, str]]) -> AsyncGenerator[str, None]:
+        """Stream assistant text deltas for an OpenAI-style message list."""
+        async for delta in self.chat_events(messages=messages):
+            if delta.content:
+                yield delta.content
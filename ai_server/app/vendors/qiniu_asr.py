@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Union
+
+from app.support import http_pool
+from app.support.limiter import limiters
+from app.support.upload import AudioUpload
+import config
+
+logger = logging.getLogger(__name__)
+
+
+async def recognize(audio: Union[str, AudioUpload], audio_format: str = "mp3") -> Dict[str, Any]:
+    """Call the Qiniu ASR API with inline base64 audio and return its JSON response.
+
+    `audio` is either the base64 string or an AudioUpload, which is encoded
+    while the request body streams out (with a known Content-Length).
+    Raises httpx.HTTPStatusError on a non-2xx response and
+    UpstreamBusyError when the ASR limiter has no slot (or on 429).
+    """
+    client = http_pool.get_client()
+    headers = {
+        "Authorization": f"Bearer {config.QINIU_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    async with limiters["asr"].slot() as limiter:
+        if isinstance(audio, AudioUpload):
+            prefix, suffix = _body_parts(audio_format)
+            headers["Content-Length"] = str(len(prefix) + audio.base64_size + len(suffix))
+            response = await client.post(
+                config.QINIU_ASR_URL,
+                headers=headers,
+                content=_streamed_body(prefix, audio, suffix),
+            )
+        else:
+            response = await client.post(
+                config.QINIU_ASR_URL,
+                headers=headers,
+                json={
+                    "model": "asr",
+                    "audioBase64": audio,  # 使用 audioBase64 参数
+                    "format": audio_format
+                }
+            )
+        logger.debug("ASR response status: %s, headers: %s", response.status_code, dict(response.headers))
+        limiter.observe(response)
+    response.raise_for_status()
+    return response.json()
+
+
+async def recognize_url(audio_url: str, audio_format: str = "mp3") -> Dict[str, Any]:
+    """Call the Qiniu ASR API with the URL of an uploaded clip instead of inline audio."""
+    client = http_pool.get_client()
+    async with limiters["asr"].slot() as limiter:
+        response = await client.post(
+            config.QINIU_ASR_URL,
+            headers={
+                "Authorization": f"Bearer {config.QINIU_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "asr",
+                "audio": {"format": audio_format, "url": audio_url}
+            }
+        )
+        logger.debug("ASR response status: %s, headers: %s", response.status_code, dict(response.headers))
+        limiter.observe(response)
+    response.raise_for_status()
+    return response.json()
+
+
+def _body_parts(audio_format: str) -> "tuple[bytes, bytes]":
+    # Same JSON document as the json= branch, split around the base64 payload
+    marker = "\x00"
+    body = json.dumps({"model": "asr", "audioBase64": marker, "format": audio_format}, separators=(",", ":"))
+    prefix, _, suffix = body.partition(json.dumps(marker))
+    return (prefix + '"').encode("utf-8"), ('"' + suffix).encode("utf-8")
+
+
+async def _streamed_body(prefix: bytes, audio: AudioUpload, suffix: bytes) -> AsyncIterator[bytes]:
+    yield prefix
+    async for chunk in audio.base64_chunks():
+        yield chunk
+    yield suffix
+
+
+def recognized_text(response_data: Dict[str, Any]) -> str:
+    return response_data.get("data", {}).get("result", {}).get("text", "")
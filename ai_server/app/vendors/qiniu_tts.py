@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+from app.support import http_pool
+from app.support.limiter import limiters
+import config
+
+
+# 人物语音映射和风格 - 使用七牛云不同的音色
+VOICE_MAPPING: Dict[str, Dict[str, Any]] = {
+    "harrypotter": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 11,  # 精品男声，男孩，活泼开朗 - 适合年轻的哈利波特
+        "speed_ratio": 1.1,
+        "style_prefix": "作为哈利·波特，我用年轻而勇敢的语气说："
+    },
+    "einstein": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 10,  # 精品男声，成熟正式，播音腔 - 适合深思熟虑的爱因斯坦
+        "speed_ratio": 0.9,
+        "style_prefix": "作为爱因斯坦，我用深思熟虑的语调说："
+    },
+    "confucius": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 13,  # 精品男声，央视新闻播音腔 - 适合庄重的孔子
+        "speed_ratio": 0.8,
+        "style_prefix": "作为孔子，我用庄重而智慧的语调说："
+    },
+    "socrates": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 12,  # 精品男声，常见解说配音腔 - 适合思辨的苏格拉底
+        "speed_ratio": 0.9,
+        "style_prefix": "作为苏格拉底，我用质疑和思辨的语调说："
+    },
+    "shakespeare": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 7,   # 精品女声，成熟，声音柔和纯美 - 适合戏剧性的莎士比亚
+        "speed_ratio": 1.0,
+        "style_prefix": "作为莎士比亚，我用戏剧性的语调说："
+    },
+    "marie-curie": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 14,  # 精品女声，少女音色 - 适合坚定的居里夫人
+        "speed_ratio": 1.0,
+        "style_prefix": "作为居里夫人，我用坚定而科学的语调说："
+    },
+    "default": {
+        "voice_type": "qiniu_zh_female_wwxkjx",
+        "spkid": 7,   # 默认使用精品女声
+        "speed_ratio": 1.0,
+        "style_prefix": ""
+    }
+}
+
+
+def resolve_voice(voice: Optional[str]) -> Dict[str, Any]:
+    """Voice settings for a character id, falling back to the default voice."""
+    return VOICE_MAPPING.get((voice or "").lower(), VOICE_MAPPING["default"])
+
+
+def styled_text(text: str, voice_config: Dict[str, Any]) -> str:
+    style_prefix = voice_config["style_prefix"]
+    return f"{style_prefix}{text}" if style_prefix else text
+
+
+def synthesis_key(voice_config: Dict[str, Any], text: str) -> Tuple[str, int, float, str]:
+    """Everything that determines the synthesized audio."""
+    return (voice_config["voice_type"], voice_config["spkid"], voice_config["speed_ratio"], text)
+
+
+async def synthesize(voice_config: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """Call the Qiniu TTS API and return its JSON response.
+
+    `text` is the final (already styled) text. Raises httpx.HTTPStatusError
+    on a non-2xx response and UpstreamBusyError when the TTS limiter has no
+    slot (or on 429).
+    """
+    client = http_pool.get_client()
+    async with limiters["tts"].slot() as limiter:
+        response = await client.post(
+            config.QINIU_TTS_URL,
+            headers={
+                "Authorization": f"Bearer {config.QINIU_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "audio": {
+                    "voice_type": voice_config["voice_type"],
+                    "spkid": voice_config["spkid"],
+                    "encoding": "mp3",
+                    "speed_ratio": voice_config["speed_ratio"]
+                },
+                "request": {
+                    "text": text
+                }
+            }
+        )
+        limiter.observe(response)
+    response.raise_for_status()
+    return response.json()
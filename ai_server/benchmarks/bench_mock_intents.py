@@ -0,0 +1,82 @@
+"""Per-request intent matching cost of MockLLM against the old if/elif chains.
+
+Run from ai_server/:  python -m benchmarks.bench_mock_intents
+"""
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from app.vendors.mock_llm import character_matcher
+from app.vendors.mock_responses import RESPONSES
+
+QUERIES = [
+    "你好",
+    "你是谁？",
+    "你今天都干了什么",
+    "能不能给我讲讲你最喜欢的书",
+    "谁是你最好的朋友",
+    "Tell me something about your research on radioactivity",
+    "我有点担心明天的考试，你有什么建议吗",
+    "随便聊聊吧",
+]
+
+
+def legacy_chain(table: Dict, text_lower: str) -> Tuple[List[str], int]:
+    """One old `_get_*_responses` method: intents checked in order with `in` scans.
+
+    Returns the responses and the number of substring scans it took.
+    """
+    scans = 0
+    for intent in table["intents"]:
+        for word in intent["keywords"]:
+            scans += 1
+            if word in text_lower:
+                return intent["responses"], scans
+        prefix = intent.get("starts_with")
+        if prefix and text_lower.startswith(prefix):
+            scans += len(intent["unless"])
+            if not any(word in text_lower for word in intent["unless"]):
+                return intent["responses"], scans
+    return table["fallback"], scans
+
+
+def legacy_request(text: str, character_id: str) -> List[str]:
+    """The old stream_generate: every character's chain ran, one result was used."""
+    text_lower = text.lower().strip()
+    results = {cid: legacy_chain(table, text_lower)[0] for cid, table in RESPONSES.items()}
+    return results.get(character_id, results["default"])
+
+
+def matcher_request(text: str, character_id: str) -> List[str]:
+    return character_matcher(character_id).responses_for(text.lower().strip())
+
+
+def bench(fn: Callable[[str, str], List[str]], workload: List[Tuple[str, str]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text, character_id in workload:
+            fn(text, character_id)
+        best = min(best, time.perf_counter() - started)
+    return best / len(workload)
+
+
+def main() -> None:
+    rng = random.Random(7)
+    characters = list(RESPONSES)
+    workload = [(rng.choice(QUERIES), rng.choice(characters)) for _ in range(20_000)]
+    for text, character_id in workload[:500]:
+        assert legacy_request(text, character_id) == matcher_request(text, character_id), "intent differs"
+    character_matcher("default")  # compile outside the timed loop
+
+    for text in QUERIES:
+        scans = sum(legacy_chain(table, text.lower().strip())[1] for table in RESPONSES.values())
+        print(f"{scans:>5} substring scans per request: {text}")
+    legacy = bench(legacy_request, workload, 5)
+    new = bench(matcher_request, workload, 5)
+    print(f"legacy chains: {legacy * 1e6:7.2f} us/request")
+    print(f"matcher:       {new * 1e6:7.2f} us/request ({legacy / new:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Cost of many concurrent MockLLM streams: shared tick clock vs one timer per sleep.
+
+Run from ai_server/:  python -m benchmarks.bench_mock_llm
+"""
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+from app.support.clock import TickClock
+from app.vendors.mock_llm import MockLLM, MockProfile, MockUpstream
+
+PROFILE = MockProfile(
+    ttft_ms=400,
+    ttft_jitter=0.3,
+    tokens_per_sec=30,
+    chunk_min=1,
+    chunk_max=4,
+    seed=7,
+)
+
+
+class LoopClock(TickClock):
+    """One event-loop timer per sleep, i.e. plain asyncio.sleep."""
+
+    async def sleep_until(self, deadline: float) -> None:
+        self.sleeps += 1
+        self.timers += 1
+        await asyncio.sleep(deadline - self.time())
+
+
+async def one_stream(llm: MockLLM) -> Tuple[float, float]:
+    started = time.perf_counter()
+    first = 0.0
+    async for _ in llm.stream_generate("你今天都干了什么", "harrypotter"):
+        if not first:
+            first = time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+async def run(clock: TickClock, streams: int) -> Tuple[float, float, List[Tuple[float, float]], MockUpstream]:
+    upstream = MockUpstream(PROFILE, clock)
+    llm = MockLLM(upstream)
+    started, cpu = time.perf_counter(), time.process_time()
+    timings = await asyncio.gather(*(one_stream(llm) for _ in range(streams)))
+    return time.perf_counter() - started, time.process_time() - cpu, timings, upstream
+
+
+def main() -> None:
+    for streams in (1_000, 5_000, 10_000, 20_000):
+        for name, clock in (("loop timers", LoopClock()), ("tick clock ", TickClock(0.005))):
+            wall, cpu, timings, upstream = asyncio.run(run(clock, streams))
+            ttft = statistics.median(t[0] for t in timings) * 1000
+            total = statistics.median(t[1] for t in timings) * 1000
+            print(
+                f"{streams:>6} streams, {name}: wall {wall:5.2f}s cpu {cpu:5.2f}s, "
+                f"median ttft {ttft:5.0f}ms total {total:5.0f}ms, "
+                f"{upstream.chunks / streams:4.1f} chunks/stream, {clock.timers:>7} timers"
+            )
+
+
+if __name__ == "__main__":
+    main()
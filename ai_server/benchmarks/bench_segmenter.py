@@ -0,0 +1,88 @@
+"""Throughput of StreamSegmenter against the old per-character loop.
+
+Run from ai_server/:  python -m benchmarks.bench_segmenter
+"""
+import random
+import time
+from typing import Iterable, List
+
+from app.support.segmenter import WORD_BOUNDARY, StreamSegmenter
+
+PHRASES = [
+    "你好！我是阿尔伯特·爱因斯坦，很高兴见到你。",
+    "想象力比知识更重要，因为知识是有限的。",
+    "Imagination is more important than knowledge, isn't it? ",
+    "时间和空间是相对的；质量和能量可以互相转换：E=mc²。",
+    "我们在霍格沃茨学习魔法、飞行和魔药学！",
+]
+
+
+def legacy_segments(deltas: Iterable[str]) -> List[str]:
+    """The per-character loop of iter_words (used by the chat services), run synchronously."""
+    punctuation = set(WORD_BOUNDARY)
+    out: List[str] = []
+    buffer = ""
+    for delta in deltas:
+        for ch in delta:
+            buffer += ch
+            if ch in punctuation:
+                word = buffer.strip()
+                if word:
+                    out.append(word)
+                buffer = ""
+    if buffer.strip():
+        out.append(buffer.strip())
+    return out
+
+
+def segmenter_segments(deltas: Iterable[str], granularity: str = "word") -> List[str]:
+    segmenter = StreamSegmenter(granularity)
+    out: List[str] = []
+    for delta in deltas:
+        out.extend(segmenter.feed(delta))
+    out.extend(segmenter.flush())
+    return out
+
+
+def make_deltas(rng: random.Random, total_chars: int, max_delta: int) -> List[str]:
+    text = ""
+    while len(text) < total_chars:
+        text += rng.choice(PHRASES)
+    deltas = []
+    pos = 0
+    while pos < len(text):
+        size = rng.randint(1, max_delta)
+        deltas.append(text[pos:pos + size])
+        pos += size
+    return deltas
+
+
+def bench(fn, deltas: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(deltas)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    rng = random.Random(7)
+    for max_delta in (1, 4, 16, 64, 256):
+        deltas = make_deltas(rng, 200_000, max_delta)
+        assert legacy_segments(deltas) == segmenter_segments(deltas), "word segmentation differs"
+        chars = sum(len(d) for d in deltas)
+        legacy = bench(legacy_segments, deltas, 5)
+        new = bench(segmenter_segments, deltas, 5)
+        print(
+            f"deltas<= {max_delta:>3} chars: legacy {chars / legacy / 1e6:6.2f} Mchar/s, "
+            f"segmenter {chars / new / 1e6:6.2f} Mchar/s ({legacy / new:4.1f}x)"
+        )
+    for granularity in ("clause", "sentence"):
+        deltas = make_deltas(rng, 200_000, 16)
+        seconds = bench(lambda d, g=granularity: segmenter_segments(d, g), deltas, 5)
+        print(f"{granularity:>8}: {sum(len(d) for d in deltas) / seconds / 1e6:6.2f} Mchar/s")
+
+
+if __name__ == "__main__":
+    main()
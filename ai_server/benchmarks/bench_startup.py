@@ -0,0 +1,88 @@
+"""Cold-start cost of a worker: import time and time-to-ready, per AI_PROVIDER.
+
+Each run is a fresh interpreter that imports app.main, runs the lifespan
+startup and serves one request. Also lists the slowest imports
+(python -X importtime) so regressions are easy to spot.
+
+Run from ai_server/:  python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD = """
+import json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    ready = time.perf_counter()
+    client.get("/v1/characters").raise_for_status()
+    served = time.perf_counter()
+    print(json.dumps({
+        "importMs": (imported - started) * 1000,
+        "startupMs": (ready - imported) * 1000,
+        "firstRequestMs": (served - ready) * 1000,
+        "readyMs": (served - started) * 1000,
+    }))
+"""
+
+
+def child_env(provider: str) -> Dict[str, str]:
+    env = dict(os.environ, AI_PROVIDER=provider, TTS_PREWARM_ON_STARTUP="false")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def cold_start(provider: str) -> Dict[str, float]:
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, env=child_env(provider),
+        capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["processMs"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def slowest_imports(provider: str, top: int) -> List[Tuple[float, str]]:
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], cwd=ROOT, env=child_env(provider),
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # one space after the bar, then two per nesting level; level 1 = imported by app.main
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    runs = 5
+    for provider in ("openai", "mock"):
+        results = [cold_start(provider) for _ in range(runs)]
+        summary = ", ".join(
+            f"{key} {statistics.median(r[key] for r in results):6.1f}"
+            for key in ("importMs", "startupMs", "firstRequestMs", "readyMs", "processMs")
+        )
+        print(f"AI_PROVIDER={provider:<6} (median of {runs}): {summary}")
+    print("slowest imports under app.main (cumulative ms):")
+    for ms, name in slowest_imports("openai", 8):
+        print(f"  {ms:7.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
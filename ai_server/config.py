@@ -1,16 +1,136 @@
 import os
+import tempfile
 
 # 七牛云 OpenAI 兼容 API 配置
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "sk-8b4e21c2efb5e8cc357dc1f3932dca4d644b79758d2a7bd2fe3d053ca809d5e2")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "qwen3-max") 
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://openai.qiniu.com/v1")
+# 流式响应末尾返回 token 用量（stream_options.include_usage）
+OPENAI_STREAM_USAGE = os.getenv("OPENAI_STREAM_USAGE", "true").lower() in ("1", "true", "yes")
+
+# MockLLM 上游模拟（AI_PROVIDER=mock，压测用）；默认值与原先逐字 10ms 的输出一致
+# 首 token 延迟：中位数（毫秒）+ 对数正态抖动（sigma，0 为固定值）
+MOCK_LLM_TTFT_MS = float(os.getenv("MOCK_LLM_TTFT_MS", "0"))
+MOCK_LLM_TTFT_JITTER = float(os.getenv("MOCK_LLM_TTFT_JITTER", "0"))
+# 输出速率（token/秒，一个字符算一个 token，0 为不限速）和每个 chunk 的 token 数范围
+MOCK_LLM_TOKENS_PER_SEC = float(os.getenv("MOCK_LLM_TOKENS_PER_SEC", "100"))
+MOCK_LLM_CHUNK_MIN = int(os.getenv("MOCK_LLM_CHUNK_MIN", "1"))
+MOCK_LLM_CHUNK_MAX = int(os.getenv("MOCK_LLM_CHUNK_MAX", "1"))
+# 故障注入：出错 / 卡住后超时的流所占比例，超时前卡住的秒数
+MOCK_LLM_ERROR_RATE = float(os.getenv("MOCK_LLM_ERROR_RATE", "0"))
+MOCK_LLM_TIMEOUT_RATE = float(os.getenv("MOCK_LLM_TIMEOUT_RATE", "0"))
+MOCK_LLM_TIMEOUT_SECONDS = float(os.getenv("MOCK_LLM_TIMEOUT_SECONDS", "30"))
+# 随机种子（留空则不固定）；定时器合并粒度（毫秒）
+MOCK_LLM_SEED = os.getenv("MOCK_LLM_SEED", "")
+MOCK_LLM_TICK_MS = float(os.getenv("MOCK_LLM_TICK_MS", "5"))
 
 # 七牛云 TTS 配置
 QINIU_API_KEY = os.getenv("QINIU_API_KEY", "sk-8b4e21c2efb5e8cc357dc1f3932dca4d644b79758d2a7bd2fe3d053ca809d5e2")
 QINIU_TTS_URL = os.getenv("QINIU_TTS_URL", "https://openai.qiniu.com/v1/voice/tts")
+QINIU_ASR_URL = os.getenv("QINIU_ASR_URL", "https://openai.qiniu.com/v1/voice/asr")
 
 # 七牛云对象存储配置（用于 ASR 音频文件上传）
 QINIU_ACCESS_KEY = os.getenv("QINIU_ACCESS_KEY", "MxhljuBGXaJPHPs8e1eJd5Z9oX1RyWlpbig8bfQi")
 QINIU_SECRET_KEY = os.getenv("QINIU_SECRET_KEY", "gqwFfaqB8YeJuqk2iQCIvoP2A1YhL3Orirb7yW3i")
 QINIU_BUCKET_NAME = os.getenv("QINIU_BUCKET_NAME", "braca-ars-audio")
 QINIU_DOMAIN = os.getenv("QINIU_DOMAIN", "t3aicvv9s.hn-bkt.clouddn.com")
+
+# 上游 HTTP 连接池配置（LLM / TTS / ASR 共用）
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes")
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+
+# 多轮对话上下文预算（token 估算值）
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "6000"))
+# 按模型覆盖，格式："qwen3-max:8000,gpt-4o-mini:4000"
+CONTEXT_TOKEN_BUDGETS = {
+    name.strip(): int(value)
+    for name, _, value in (item.partition(":") for item in os.getenv("CONTEXT_TOKEN_BUDGETS", "").split(","))
+    if name.strip() and value.strip()
+}
+CONTEXT_REPLY_RESERVE = int(os.getenv("CONTEXT_REPLY_RESERVE", "512"))
+CONTEXT_SUMMARY_TOKENS = int(os.getenv("CONTEXT_SUMMARY_TOKENS", "400"))
+# 早期对话摘要方式："extractive"（本地截取，无额外调用）或 "llm"
+CONTEXT_SUMMARY_MODE = os.getenv("CONTEXT_SUMMARY_MODE", "extractive").lower()
+
+# /v1/chat 回复缓存（完全相同的角色 + 对话 + 模型）
+CHAT_CACHE_ENABLED = os.getenv("CHAT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CHAT_CACHE_MAX_ENTRIES = int(os.getenv("CHAT_CACHE_MAX_ENTRIES", "2048"))
+CHAT_CACHE_TTL = float(os.getenv("CHAT_CACHE_TTL", "600"))
+# 历史消息数达到该值的对话不缓存
+CHAT_CACHE_MAX_HISTORY = int(os.getenv("CHAT_CACHE_MAX_HISTORY", "4"))
+
+# 人设文件热加载检查间隔（秒），0 表示关闭
+PERSONA_RELOAD_INTERVAL = float(os.getenv("PERSONA_RELOAD_INTERVAL", "5"))
+
+# 上游并发与速率限制（每个服务商独立）；速率为每秒请求数，0 表示不限
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+LLM_RATE_PER_SEC = float(os.getenv("LLM_RATE_PER_SEC", "0"))
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", "16"))
+TTS_RATE_PER_SEC = float(os.getenv("TTS_RATE_PER_SEC", "0"))
+ASR_MAX_CONCURRENCY = int(os.getenv("ASR_MAX_CONCURRENCY", "8"))
+ASR_RATE_PER_SEC = float(os.getenv("ASR_RATE_PER_SEC", "0"))
+UPSTREAM_MAX_QUEUE = int(os.getenv("UPSTREAM_MAX_QUEUE", "200"))
+UPSTREAM_QUEUE_TIMEOUT = float(os.getenv("UPSTREAM_QUEUE_TIMEOUT", "15"))
+
+# TTS 音频缓存：内存 LRU + 磁盘（目录留空则只用内存）
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "ai_server_tts_cache"))
+TTS_CACHE_MEMORY_MB = int(os.getenv("TTS_CACHE_MEMORY_MB", "64"))
+TTS_CACHE_DISK_MB = int(os.getenv("TTS_CACHE_DISK_MB", "1024"))
+
+# 长文本按句切分后并发合成：最大并发数，短于该字数的句子与下一句合并
+TTS_PIPELINE_PARALLELISM = int(os.getenv("TTS_PIPELINE_PARALLELISM", "4"))
+TTS_PIPELINE_MIN_CHARS = int(os.getenv("TTS_PIPELINE_MIN_CHARS", "8"))
+
+# 批量 TTS：单次请求最多条目数，去重后的最大并发合成数
+TTS_BATCH_MAX_ITEMS = int(os.getenv("TTS_BATCH_MAX_ITEMS", "200"))
+TTS_BATCH_PARALLELISM = int(os.getenv("TTS_BATCH_PARALLELISM", "4"))
+
+# TTS 缓存预热：启动时是否自动运行、每秒最多合成条数、每个角色最多预热条数（0 为全部），
+# 以及额外的问候语（用 | 分隔，对每个角色的音色都会预热）
+TTS_PREWARM_ON_STARTUP = os.getenv("TTS_PREWARM_ON_STARTUP", "false").lower() in ("1", "true", "yes")
+TTS_PREWARM_RATE = float(os.getenv("TTS_PREWARM_RATE", "0.5"))
+TTS_PREWARM_MAX_PER_CHARACTER = int(os.getenv("TTS_PREWARM_MAX_PER_CHARACTER", "0"))
+TTS_PREWARM_GREETINGS = [
+    g.strip() for g in os.getenv("TTS_PREWARM_GREETINGS", "你好！很高兴见到你！").split("|") if g.strip()
+]
+
+# ASR 上传：请求体最大字节数；超过内存阈值的上传转存到临时文件
+ASR_MAX_UPLOAD_MB = int(os.getenv("ASR_MAX_UPLOAD_MB", "50"))
+ASR_SPOOL_MEMORY_KB = int(os.getenv("ASR_SPOOL_MEMORY_KB", "1024"))
+
+# ASR 预处理（仅 PCM WAV，需要 numpy）：下混为单声道、裁掉首尾静音、重采样到目标采样率
+ASR_PREPROCESS_ENABLED = os.getenv("ASR_PREPROCESS_ENABLED", "true").lower() in ("1", "true", "yes")
+ASR_TARGET_SAMPLE_RATE = int(os.getenv("ASR_TARGET_SAMPLE_RATE", "16000"))
+ASR_VAD_THRESHOLD_DB = float(os.getenv("ASR_VAD_THRESHOLD_DB", "-45"))
+ASR_VAD_PAD_MS = int(os.getenv("ASR_VAD_PAD_MS", "200"))
+
+# ASR 结果缓存：按音频内容哈希缓存识别文本（重试 / 重复上传不再调用上游）
+ASR_CACHE_ENABLED = os.getenv("ASR_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ASR_CACHE_MAX_ENTRIES = int(os.getenv("ASR_CACHE_MAX_ENTRIES", "4096"))
+ASR_CACHE_TTL = float(os.getenv("ASR_CACHE_TTL", "3600"))
+
+# 长音频（仅 PCM WAV）：超过该时长时在停顿处切成不超过 ASR_SEGMENT_SECONDS 的片段并发识别；
+# 切点不在停顿处时相邻片段重叠 ASR_SEGMENT_OVERLAP_MS
+ASR_LONG_AUDIO_SECONDS = float(os.getenv("ASR_LONG_AUDIO_SECONDS", "30"))
+ASR_SEGMENT_SECONDS = float(os.getenv("ASR_SEGMENT_SECONDS", "20"))
+ASR_SEGMENT_OVERLAP_MS = int(os.getenv("ASR_SEGMENT_OVERLAP_MS", "600"))
+
+# 大音频走对象存储：超过阈值（KB，0 为关闭）的音频先上传，ASR 只收到 URL。
+# 存储后端：none（默认，音频直接内联发送）、qiniu 或 local（本地目录 + 静态文件服务）
+ASR_UPLOAD_THRESHOLD_KB = int(os.getenv("ASR_UPLOAD_THRESHOLD_KB", "2048"))
+ASR_STORAGE_BACKEND = os.getenv("ASR_STORAGE_BACKEND", "none").lower()
+# qiniu 后端的凭据只从环境变量读取（不使用上面的内置默认值），缺任何一项则不启用
+ASR_STORAGE_ACCESS_KEY = os.getenv("QINIU_ACCESS_KEY", "")
+ASR_STORAGE_SECRET_KEY = os.getenv("QINIU_SECRET_KEY", "")
+ASR_STORAGE_BUCKET = os.getenv("QINIU_BUCKET_NAME", "")
+ASR_STORAGE_DOMAIN = os.getenv("QINIU_DOMAIN", "")
+# local 后端必须配置 ASR 服务能访问到的 URL 前缀（指向 ASR_STORAGE_DIR 的静态文件服务）
+ASR_STORAGE_DIR = os.getenv("ASR_STORAGE_DIR", os.path.join(tempfile.gettempdir(), "ai_server_asr_uploads"))
+ASR_STORAGE_BASE_URL = os.getenv("ASR_STORAGE_BASE_URL", "")
+ASR_STORAGE_URL_TTL = int(os.getenv("ASR_STORAGE_URL_TTL", "3600"))
+ASR_STORAGE_PART_MB = int(os.getenv("ASR_STORAGE_PART_MB", "4"))